@@ -6,17 +6,42 @@ Updated to work with 5-slot structure and Mac service file paths
 
 import sys
 import os
+import bisect
 import json
 import time
 import subprocess
+import queue
+import fnmatch
 from datetime import datetime
 from pathlib import Path
 import logging
+import logging.handlers
+import atexit
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
 except ImportError:
     from backports.zoneinfo import ZoneInfo  # Fallback for older Python
 
+# Filesystem events (optional) - falls back to periodic rescans when missing
+try:
+    from watchdog.observers import Observer  # FSEvents on macOS, inotify on Linux
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
+    PatternMatchingEventHandler = object
+
+# Fast JSON parser (optional) - falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Streaming JSON parser (optional) - only used for unusually large job files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Hawaii timezone - ensures folders are always created with Hawaii dates
 HAWAII_TZ = ZoneInfo('Pacific/Honolulu')
 
@@ -41,6 +66,9 @@ TEMPLATE_PROJECT_NAME = "MAG_FERRARI-BACKUP"  # Your actual template project nam
 MAC_SERVICE_PROJECTS_DIR = Path("/Users/magnummedia/MagnumStream/projects")  # Mac service projects
 OUTPUT_FOLDER = Path("./rendered_videos")  # Local output folder
 COMPLETED_FOLDER = Path("./completed_jobs")  # Processed job files
+JOB_STREAM_THRESHOLD = 64 * 1024  # Job files larger than this are parsed with ijson
+RESCAN_INTERVAL = 60  # Seconds between fallback rescans (catches jobs missed by the watcher)
+JOB_SETTLE_SECONDS = 1.0  # A job file must be unmodified this long before it is claimed
 
 # Your actual DaVinci template positions (from get_clips_simple.lua output)
 CLIP_POSITIONS = {
@@ -51,21 +79,72 @@ CLIP_POSITIONS = {
     5: {"track": 3, "start_frame": 87565, "duration_frames": 48}    # Arrival side
 }
 
+# Column view of CLIP_POSITIONS, ordered by start frame, built once at import
+_SLOTS_BY_START = sorted(CLIP_POSITIONS, key=lambda slot: CLIP_POSITIONS[slot]["start_frame"])
+SLOT_IDX = {slot: i for i, slot in enumerate(_SLOTS_BY_START)}
+TRACKS = tuple(CLIP_POSITIONS[slot]["track"] for slot in _SLOTS_BY_START)
+STARTS = tuple(CLIP_POSITIONS[slot]["start_frame"] for slot in _SLOTS_BY_START)
+DURATIONS = tuple(CLIP_POSITIONS[slot]["duration_frames"] for slot in _SLOTS_BY_START)
+
 # Render Settings
 RENDER_PRESET = "YouTube 1080p"
+RENDER_POLL_MIN = 0.25  # Seconds before the first render status check
+RENDER_POLL_MAX = 2.0  # Backoff cap (the old fixed interval)
+RENDER_POLL_FINISHING = 1.0  # Interval once the render is nearly done
+RENDER_FINISHING_PERCENT = 95  # Completion at which RENDER_POLL_FINISHING applies
+RENDER_LOG_STEP = 10  # Log render progress every this many percent
 TIMELINE_NAME = "MAG_FERARRI"  # Your actual timeline name
 
-# Logging Configuration
+RESOLVE_LAUNCH_ATTEMPTS = 60  # Readiness probes after launching Resolve (~3 minutes max)
+
+# Resolve connection handles, reused by any later automation instance in this process
+_RESOLVE_CACHE = {}
+
+# Whether SetClipProperty accepts a dict of properties (None until first probed)
+_CLIP_PROPERTY_DICT_SUPPORTED = None
+
+# Logging Configuration - records are queued and written by a background listener
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('davinci_automation.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# QueueHandler pre-formats records; keep it to the bare message so the listener's format applies once
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('davinci_automation.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_log_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
+def _load_job(job_file_path):
+    """Parse a job file (each claimed job is read exactly once)"""
+    if ijson is not None and os.path.getsize(job_file_path) > JOB_STREAM_THRESHOLD:
+        return _stream_job(job_file_path)
+    
+    if orjson is not None:
+        return orjson.loads(Path(job_file_path).read_bytes())
+    
+    with open(job_file_path, 'r') as f:
+        return json.load(f)
+
+def _stream_job(job_file_path):
+    """Pull only the fields we use out of a large job file without building the full tree"""
+    job_data = {}
+    with open(job_file_path, 'rb') as f:
+        job_data['clips'] = dict(ijson.kvitems(f, 'clips', use_float=True))
+        f.seek(0)
+        for project_name in ijson.items(f, 'projectName'):
+            job_data['projectName'] = project_name
+            break
+    return job_data
+
 # ============================================================================
 # MAIN AUTOMATION CLASS
 # ============================================================================
@@ -78,11 +157,21 @@ class MagnumStreamDaVinciAutomation:
         self.current_project = None
         self.media_pool = None
         self.timeline = None
+        self._slot_targets = {}  # Slot number -> template placeholder item
+        self._job_ts = None  # Timestamp shared by the current job's bin and project names
+        self._last_bin = None  # Media pool bin holding the previous job's clips
+        self._replaced_items = []  # Template items whose take the previous job switched
         
         self._connect_to_resolve()
     
     def _connect_to_resolve(self):
         """Establish connection to DaVinci Resolve with auto-launch"""
+        # Reuse the connection from an earlier instance in this process
+        if _RESOLVE_CACHE.get("resolve"):
+            self.resolve = _RESOLVE_CACHE["resolve"]
+            self.project_manager = _RESOLVE_CACHE["project_manager"]
+            return
+        
         try:
             # First, try to connect to existing instance
             self.resolve = dvr.scriptapp("Resolve")
@@ -91,16 +180,20 @@ class MagnumStreamDaVinciAutomation:
                 logger.info("DaVinci Resolve not running, attempting to start...")
                 # Launch DaVinci Resolve
                 if sys.platform == "darwin":  # macOS
-                    subprocess.Popen(["/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/MacOS/Resolve"])
-                    time.sleep(15)  # Give it time to start
+                    # Detach so Resolve outlives this process and can be reused by later runs
+                    subprocess.Popen(
+                        ["/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/MacOS/Resolve"],
+                        close_fds=True,
+                        start_new_session=True
+                    )
                     
-                    # Retry connection
-                    for attempt in range(5):
-                        logger.info(f"Connection attempt {attempt + 1}/5...")
+                    # Probe the scripting endpoint until Resolve is ready, backing off gradually
+                    for attempt in range(RESOLVE_LAUNCH_ATTEMPTS):
                         self.resolve = dvr.scriptapp("Resolve")
                         if self.resolve:
+                            logger.info(f"Resolve ready after {attempt + 1} connection attempts")
                             break
-                        time.sleep(5)
+                        time.sleep(min(0.25 * 1.1 ** attempt, 5))
             
             if not self.resolve:
                 raise Exception("Could not connect to DaVinci Resolve")
@@ -109,6 +202,8 @@ class MagnumStreamDaVinciAutomation:
             if not self.project_manager:
                 raise Exception("Could not get Project Manager")
             
+            _RESOLVE_CACHE["resolve"] = self.resolve
+            _RESOLVE_CACHE["project_manager"] = self.project_manager
             logger.info("Successfully connected to DaVinci Resolve")
         except Exception as e:
             logger.error(f"Failed to connect to DaVinci Resolve: {e}")
@@ -118,8 +213,10 @@ class MagnumStreamDaVinciAutomation:
         """Process a MagnumStream job file"""
         try:
             # Read the MagnumStream DaVinci job file
-            with open(job_file_path, 'r') as f:
-                job_data = json.load(f)
+            job_data = _load_job(str(job_file_path))
+            
+            # One timestamp per job keeps the bin and project names in step
+            self._job_ts = get_hawaii_datetime().strftime('%Y%m%d_%H%M%S')
             
             project_name = job_data['projectName']
             clips = job_data['clips']
@@ -140,11 +237,11 @@ class MagnumStreamDaVinciAutomation:
                 return False
             
             # Render the project
-            if not self._render_project(project_name):
+            job_id = self._submit_render(project_name)
+            if not job_id:
                 return False
             
-            logger.info(f"Successfully completed MagnumStream project: {project_name}")
-            return True
+            return self._poll_render(self.current_project, job_id, project_name)
             
         except Exception as e:
             logger.error(f"Error processing MagnumStream job: {e}")
@@ -153,19 +250,29 @@ class MagnumStreamDaVinciAutomation:
     def _load_template_project(self):
         """Load the Ferrari template project"""
         try:
-            # Close any currently open project
             current = self.project_manager.GetCurrentProject()
-            if current:
-                self.project_manager.CloseProject(current)
-            
-            # Load template
-            self.current_project = self.project_manager.LoadProject(TEMPLATE_PROJECT_NAME)
-            if not self.current_project:
-                raise Exception(f"Could not load template project: {TEMPLATE_PROJECT_NAME}")
+            if current and current.GetName() == TEMPLATE_PROJECT_NAME:
+                # Template is still open (e.g. previous job failed before saving) - reuse it
+                self.current_project = current
+                self._reset_template_state()
+            else:
+                # Close any currently open project
+                if current:
+                    self.project_manager.CloseProject(current)
+                
+                # Load template
+                self.current_project = self.project_manager.LoadProject(TEMPLATE_PROJECT_NAME)
+                if not self.current_project:
+                    raise Exception(f"Could not load template project: {TEMPLATE_PROJECT_NAME}")
+                
+                # Edits tracked against a previous project no longer apply
+                self._last_bin = None
+                self._replaced_items = []
             
             self.media_pool = self.current_project.GetMediaPool()
             
             # Get the timeline
+            self.timeline = None
             timeline_count = self.current_project.GetTimelineCount()
             for i in range(1, timeline_count + 1):
                 timeline = self.current_project.GetTimelineByIndex(i)
@@ -177,6 +284,9 @@ class MagnumStreamDaVinciAutomation:
             if not self.timeline:
                 raise Exception(f"Could not find timeline: {TIMELINE_NAME}")
             
+            # Placeholder positions are fixed per template, so resolve them once per load
+            self._slot_targets = self._resolve_slot_targets()
+            
             logger.info(f"Template project '{TEMPLATE_PROJECT_NAME}' loaded successfully")
             return True
             
@@ -184,72 +294,98 @@ class MagnumStreamDaVinciAutomation:
             logger.error(f"Failed to load template project: {e}")
             return False
     
+    def _reset_template_state(self):
+        """Undo the previous job's edits on an already-loaded template"""
+        # Restore the original placeholder takes
+        for item in self._replaced_items:
+            item.SelectTakeByIndex(1)
+        self._replaced_items = []
+        
+        # Drop the bin created for the previous job's clips
+        if self._last_bin:
+            self.current_project.GetMediaPool().DeleteFolders([self._last_bin])
+            self._last_bin = None
+        
+        logger.info(f"Reusing loaded template project '{TEMPLATE_PROJECT_NAME}'")
+    
     def _replace_clips_magnumstream(self, clips):
         """Replace placeholder clips with MagnumStream recordings"""
         try:
             # Create a new bin for this project's clips
             root_folder = self.media_pool.GetRootFolder()
-            clip_bin = self.media_pool.AddSubFolder(root_folder, f"MagnumStream_{get_hawaii_datetime().strftime('%Y%m%d_%H%M%S')}")
+            clip_bin = self.media_pool.AddSubFolder(root_folder, f"MagnumStream_{self._job_ts}")
             self.media_pool.SetCurrentFolder(clip_bin)
+            self._last_bin = clip_bin
             
-            # Import all clips to media pool
-            media_items = {}
+            # Collect existing clip files so they can be imported in one call
+            clip_paths = []
+            slot_order = []
+            dir_listings = {}  # One directory read per clip folder instead of a stat per clip
             for slot_num_str, clip_info in clips.items():
-                slot_num = int(slot_num_str)
-                clip_path = Path(clip_info['fullPath'])
+                # Plain strings all the way to ImportMedia - no Path round-trip needed
+                clip_path = os.fspath(clip_info['fullPath'])
                 
-                if not clip_path.exists():
+                parent, name = os.path.split(clip_path)
+                if parent not in dir_listings:
+                    dir_listings[parent] = _list_dir_names(parent or ".")
+                if name not in dir_listings[parent]:
                     logger.warning(f"Clip file not found: {clip_path}")
                     continue
                 
-                # Import clip
-                imported = self.media_pool.ImportMedia([str(clip_path)])
-                if imported:
-                    media_items[slot_num] = {
-                        'media': imported[0],
-                        'clip_info': clip_info
-                    }
-                    logger.info(f"Imported slot {slot_num}: {clip_info['filename']}")
+                clip_paths.append(clip_path)
+                slot_order.append((int(slot_num_str), clip_info))
+            
+            # Import all clips to media pool with a single ImportMedia call
+            imported = self.media_pool.ImportMedia(clip_paths) if clip_paths else []
+            # ImportMedia doesn't promise argument order (and skips failures), so match on file path
+            by_path = {item.GetClipProperty("File Path"): item for item in imported or []}
+            imported = [by_path.get(path) for path in clip_paths]
+            
+            media_items = {}
+            for (slot_num, clip_info), media_item in zip(slot_order, imported):
+                if not media_item:
+                    logger.warning(f"Could not import slot {slot_num}: {clip_info['filename']}")
+                    continue
+                media_items[slot_num] = {
+                    'media': media_item,
+                    'clip_info': clip_info
+                }
+                logger.info(f"Imported slot {slot_num}: {clip_info['filename']}")
+            
+            # Nothing to place - fail now rather than render an untouched template
+            if not media_items:
+                logger.error("No clips imported - aborting job")
+                return False
             
             # Replace clips on timeline using exact frame positions
             for slot_num, media_data in media_items.items():
-                if slot_num not in CLIP_POSITIONS:
+                i = SLOT_IDX.get(slot_num)
+                if i is None:
                     logger.warning(f"No template position defined for slot {slot_num}")
                     continue
                 
-                position = CLIP_POSITIONS[slot_num]
-                track_index = position['track']
-                start_frame = position['start_frame']
-                template_duration = position['duration_frames']
+                track_index = TRACKS[i]
+                start_frame = STARTS[i]
+                template_duration = DURATIONS[i]
                 
                 logger.info(f"Replacing slot {slot_num} at frame {start_frame} on track {track_index}")
                 
-                # Get timeline items from the specific track
-                timeline_items = self.timeline.GetItemListInTrack('video', track_index)
-                
-                # Find the item at our target position
-                target_item = None
-                for item in timeline_items:
-                    item_start = item.GetStart()
-                    item_end = item.GetEnd()
-                    
-                    # Check if this placeholder overlaps our target frame
-                    if item_start <= start_frame < item_end:
-                        target_item = item
-                        break
+                # Placeholder overlapping our target frame (resolved at template load)
+                target_item = self._slot_targets[slot_num]
                 
                 if target_item:
                     # Set source in/out points to match template duration
                     media_item = media_data['media']
                     
                     # Use the entire 3-second clip (MagnumStream clips are already cut to size)
-                    media_item.SetClipProperty("Start", "0")
-                    media_item.SetClipProperty("End", str(template_duration))
+                    self._set_clip_range(media_item, 0, template_duration)
                     
                     # Replace using take system (most reliable method)
                     if target_item.AddTake(media_item):
+                        # AddTake appends, so the new take is the last one
                         take_count = target_item.GetTakesCount()
                         target_item.SelectTakeByIndex(take_count)
+                        self._replaced_items.append(target_item)
                         logger.info(f"✅ Successfully replaced slot {slot_num} (take {take_count})")
                     else:
                         logger.warning(f"❌ Could not replace slot {slot_num} using take system")
@@ -262,15 +398,71 @@ class MagnumStreamDaVinciAutomation:
             logger.error(f"Failed to replace clips: {e}")
             return False
     
+    def _set_clip_range(self, media_item, start, end):
+        """Set a media pool item's Start/End, in one call when Resolve accepts a dict"""
+        global _CLIP_PROPERTY_DICT_SUPPORTED
+        properties = {"Start": str(start), "End": str(end)}
+        
+        dict_rejected = False
+        if _CLIP_PROPERTY_DICT_SUPPORTED is not False:
+            try:
+                if media_item.SetClipProperty(properties):
+                    _CLIP_PROPERTY_DICT_SUPPORTED = True
+                    return
+            except TypeError:
+                # This Resolve version only takes one property per call
+                _CLIP_PROPERTY_DICT_SUPPORTED = False
+            else:
+                dict_rejected = _CLIP_PROPERTY_DICT_SUPPORTED is None
+        
+        applied = all([media_item.SetClipProperty(name, value) for name, value in properties.items()])
+        if dict_rejected and applied:
+            # Per-property calls worked on the item the dict form failed on, so the dict
+            # form itself is unsupported (a bad range or offline clip would fail both)
+            _CLIP_PROPERTY_DICT_SUPPORTED = False
+    
+    def _resolve_slot_targets(self):
+        """Map each template slot to the timeline item overlapping its start frame"""
+        # Fetch each track's items once and index them by start frame
+        track_index_map = self._build_track_index(set(TRACKS))
+        return {
+            slot_num: self._find_item_at_frame(track_index_map[TRACKS[i]], STARTS[i])
+            for slot_num, i in SLOT_IDX.items()
+        }
+    
+    def _build_track_index(self, track_indices):
+        """Map each video track to (sorted starts, ends, items) for bisect lookups"""
+        index = {}
+        for track_index in track_indices:
+            entries = sorted(
+                ((item.GetStart(), item.GetEnd(), item)
+                 for item in self.timeline.GetItemListInTrack('video', track_index) or []),
+                key=lambda entry: entry[0]
+            )
+            index[track_index] = (
+                [entry[0] for entry in entries],
+                [entry[1] for entry in entries],
+                [entry[2] for entry in entries]
+            )
+        return index
+    
+    def _find_item_at_frame(self, track_entries, frame):
+        """Return the timeline item whose [start, end) range contains frame"""
+        starts, ends, items = track_entries
+        i = bisect.bisect_right(starts, frame) - 1
+        if i >= 0 and frame < ends[i]:
+            return items[i]
+        return None
+    
     def _save_project(self, project_name):
         """Save the project with a new name"""
         try:
-            # Save current state
-            self.project_manager.SaveProject()
-            
-            # Rename the project
-            sanitized_name = f"MagnumStream_{project_name}_{get_hawaii_datetime().strftime('%Y%m%d_%H%M%S')}"
-            self.current_project.SetName(sanitized_name)
+            # Rename the project (a single save afterwards captures the edits and the new name)
+            sanitized_name = f"MagnumStream_{project_name}_{self._job_ts}"
+            if not self.current_project.SetName(sanitized_name):
+                # Discard this job's edits so the template isn't saved under its own name
+                self.project_manager.CloseProject(self.current_project)
+                raise Exception(f"Could not rename project to: {sanitized_name}")
             self.project_manager.SaveProject()
             
             logger.info(f"Project saved as: {sanitized_name}")
@@ -280,8 +472,8 @@ class MagnumStreamDaVinciAutomation:
             logger.error(f"Failed to save project: {e}")
             return False
     
-    def _render_project(self, project_name):
-        """Set up and start rendering"""
+    def _submit_render(self, project_name):
+        """Set up and start rendering, returning the render job ID"""
         try:
             # Ensure output directory exists
             OUTPUT_FOLDER.mkdir(exist_ok=True)
@@ -322,10 +514,21 @@ class MagnumStreamDaVinciAutomation:
                 raise Exception("Could not start rendering")
             
             logger.info(f"Rendering started with job ID: {job_id}")
+            return job_id
             
-            # Wait for render to complete
+        except Exception as e:
+            logger.error(f"Failed to render project: {e}")
+            return None
+    
+    def _poll_render(self, project, job_id, project_name):
+        """Poll GetRenderJobStatus with adaptive backoff until the job ends"""
+        try:
+            # Wait for render to complete: back off to the old fixed interval, and only poll
+            # faster again once the end is near so completion is noticed promptly
+            poll_interval = RENDER_POLL_MIN
+            next_log_percent = 0
             while True:
-                status = self.current_project.GetRenderJobStatus(job_id)
+                status = project.GetRenderJobStatus(job_id)
                 if status['JobStatus'] == 'Complete':
                     logger.info("Rendering completed successfully")
                     break
@@ -334,11 +537,19 @@ class MagnumStreamDaVinciAutomation:
                 elif status['JobStatus'] == 'Cancelled':
                     raise Exception("Render was cancelled")
                 
-                # Show progress
+                # Show progress in coarse steps
                 completion = status.get('CompletionPercentage', 0)
-                logger.info(f"Rendering progress: {completion}%")
-                time.sleep(2)
+                if completion >= next_log_percent:
+                    logger.info(f"Rendering progress: {completion}%")
+                    next_log_percent = (int(completion) // RENDER_LOG_STEP + 1) * RENDER_LOG_STEP
+                
+                time.sleep(poll_interval)
+                if completion >= RENDER_FINISHING_PERCENT:
+                    poll_interval = RENDER_POLL_FINISHING
+                else:
+                    poll_interval = min(poll_interval * 2, RENDER_POLL_MAX)
             
+            logger.info(f"Successfully completed MagnumStream project: {project_name}")
             return True
             
         except Exception as e:
@@ -349,47 +560,216 @@ class MagnumStreamDaVinciAutomation:
 # JOB PROCESSING
 # ============================================================================
 
+# Rescan bookkeeping: directory mtimes and the last known project folders
+_DIR_MTIMES = {}
+_project_dirs = []
+
+class JobFileEventHandler(PatternMatchingEventHandler):
+    """Queue newly created (or moved-in) DaVinci job files for processing"""
+    def __init__(self, job_queue):
+        super().__init__(patterns=["job_*.json"], ignore_directories=True)
+        self.job_queue = job_queue
+    
+    def on_created(self, event):
+        self.job_queue.put(event.src_path)
+    
+    def on_moved(self, event):
+        # Moves out of the folder (e.g. our own claim into processing/) aren't new jobs
+        if fnmatch.fnmatch(os.path.basename(event.dest_path), "job_*.json"):
+            self.job_queue.put(event.dest_path)
+
+def _list_dir_names(directory):
+    """Return the entry names in a directory (empty if it can't be read)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def _changed_since_last_scan(directory):
+    """Return True if a directory's mtime moved since the last rescan (or it is new)"""
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        _DIR_MTIMES.pop(directory, None)
+        return False
+    if _DIR_MTIMES.get(directory) == mtime_ns:
+        return False
+    _DIR_MTIMES[directory] = mtime_ns
+    return True
+
+def _scan_for_jobs(job_queue):
+    """Queue pending job files, re-reading only directories whose contents changed"""
+    global _project_dirs
+    
+    # Adding or removing a project folder bumps the projects directory mtime
+    if _changed_since_last_scan(str(MAC_SERVICE_PROJECTS_DIR)):
+        try:
+            with os.scandir(MAC_SERVICE_PROJECTS_DIR) as project_entries:
+                _project_dirs = [entry.path for entry in project_entries if entry.is_dir()]
+        except OSError as e:
+            logger.warning(f"Could not scan projects directory: {e}")
+            return
+    
+    for project_dir in _project_dirs:
+        davinci_dir = os.path.join(project_dir, "davinci")
+        if not _changed_since_last_scan(davinci_dir):
+            continue
+        for name in _list_dir_names(davinci_dir):
+            if name.startswith("job_") and name.endswith(".json"):
+                job_queue.put(os.path.join(davinci_dir, name))
+
+def _wait_until_settled(job_file):
+    """Wait until a job file has been unmodified for JOB_SETTLE_SECONDS; False if it vanished"""
+    # ClipGenerator writes job files in place, so a just-created file may still be filling up
+    last_size = None
+    while True:
+        try:
+            stat = job_file.stat()
+        except FileNotFoundError:
+            return False
+        age = time.time() - stat.st_mtime
+        if age >= JOB_SETTLE_SECONDS and stat.st_size == last_size:
+            return True
+        last_size = stat.st_size
+        time.sleep(max(JOB_SETTLE_SECONDS - age, 0.1))
+
+def _claim_job_file(job_file):
+    """Atomically move a job into processing/ so no other watcher picks it up
+    
+    Returns the claimed path, or None if another process got there first.
+    """
+    processing_dir = job_file.parent / "processing"
+    processing_dir.mkdir(exist_ok=True)
+    claimed_path = processing_dir / f"{os.getpid()}_{job_file.name}"
+    try:
+        os.rename(job_file, claimed_path)
+    except FileNotFoundError:
+        return None
+    return claimed_path
+
+def _pid_alive(pid):
+    """True if a process with this PID is running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, but owned by another user
+    return True
+
+def _recover_orphaned_jobs():
+    """Put back jobs claimed by a process that died before finishing them"""
+    try:
+        project_entries = list(os.scandir(MAC_SERVICE_PROJECTS_DIR))
+    except OSError:
+        return
+    for project_entry in project_entries:
+        processing_dir = os.path.join(project_entry.path, "davinci", "processing")
+        for name in _list_dir_names(processing_dir):
+            pid, _, job_name = name.partition("_")
+            if not pid.isdigit() or not fnmatch.fnmatch(job_name, "job_*.json"):
+                continue
+            # Our own PID here can only be a leftover from an earlier process that had it
+            if int(pid) != os.getpid() and _pid_alive(int(pid)):
+                continue
+            job_path = os.path.join(project_entry.path, "davinci", job_name)
+            if os.path.exists(job_path):
+                logger.warning(f"Not recovering {name}: {job_path} already exists")
+                continue
+            try:
+                os.rename(os.path.join(processing_dir, name), job_path)
+                logger.info(f"Recovered interrupted job: {job_path}")
+            except OSError as e:
+                logger.warning(f"Could not recover interrupted job {name}: {e}")
+
+def _finish_job_file(job_file, claimed_path, succeeded):
+    """Move a claimed job file to completed/ or back as .error"""
+    # A failed move must not be blamed on the job (or the next one): log it and carry on
+    try:
+        if succeeded:
+            # Move to completed folder on success
+            COMPLETED_FOLDER.mkdir(exist_ok=True)
+            completed_path = COMPLETED_FOLDER / job_file.name
+            os.rename(claimed_path, completed_path)
+            logger.info(f"Job completed and moved to: {completed_path}")
+        else:
+            # Rename with .error extension
+            error_path = job_file.with_suffix('.error')
+            os.rename(claimed_path, error_path)
+            logger.error(f"Job failed, renamed to: {error_path}")
+    except OSError as e:
+        logger.error(f"Could not move finished job file {claimed_path}: {e}")
+
+def _handle_job_file(automation, job_file):
+    """Process a single job file and move it to completed/ or .error"""
+    job_file = Path(job_file)
+    
+    # Creation is reported before the producer has finished writing
+    if not _wait_until_settled(job_file):
+        return
+    
+    # Duplicate events (or a rescan) may hand us a job that was already claimed
+    claimed_path = _claim_job_file(job_file)
+    if claimed_path is None:
+        return
+    
+    logger.info(f"Found MagnumStream job: {job_file.name}")
+    
+    # Process the job
+    _finish_job_file(job_file, claimed_path, automation.process_magnumstream_job(claimed_path))
+
 def process_magnumstream_jobs():
     """Watch for MagnumStream job files and process them"""
     automation = MagnumStreamDaVinciAutomation()
+    job_queue = queue.Queue()
     
     logger.info("Watching for MagnumStream job files...")
     logger.info(f"Projects directory: {MAC_SERVICE_PROJECTS_DIR}")
     
-    while True:
+    # Sleep until the OS reports a new job file instead of polling the tree
+    observer = None
+    if Observer is not None:
         try:
-            # Look for DaVinci job files in project directories
-            for project_dir in MAC_SERVICE_PROJECTS_DIR.glob("*"):
-                if project_dir.is_dir():
-                    davinci_dir = project_dir / "davinci"
-                    if davinci_dir.exists():
-                        job_files = list(davinci_dir.glob("job_*.json"))
-                        
-                        for job_file in job_files:
-                            logger.info(f"Found MagnumStream job: {job_file.name}")
-                            
-                            # Process the job
-                            if automation.process_magnumstream_job(job_file):
-                                # Move to completed folder on success
-                                COMPLETED_FOLDER.mkdir(exist_ok=True)
-                                completed_path = COMPLETED_FOLDER / job_file.name
-                                job_file.rename(completed_path)
-                                logger.info(f"Job completed and moved to: {completed_path}")
-                            else:
-                                # Rename with .error extension
-                                error_path = job_file.with_suffix('.error')
-                                job_file.rename(error_path)
-                                logger.error(f"Job failed, renamed to: {error_path}")
-            
-            # Wait before checking again
-            time.sleep(10)
-            
-        except KeyboardInterrupt:
-            logger.info("Stopping job processor...")
-            break
-        except Exception as e:
-            logger.error(f"Error in job processing loop: {e}")
-            time.sleep(30)
+            observer = Observer()
+            observer.schedule(JobFileEventHandler(job_queue), str(MAC_SERVICE_PROJECTS_DIR), recursive=True)
+            observer.start()
+            logger.info("Filesystem watcher started")
+        except OSError as e:
+            # e.g. the Mac service hasn't created the projects directory yet
+            observer = None
+            logger.warning(f"Could not watch {MAC_SERVICE_PROJECTS_DIR} ({e}), rescanning every {RESCAN_INTERVAL}s")
+    else:
+        logger.warning(f"watchdog not installed, rescanning every {RESCAN_INTERVAL}s")
+    
+    # Pick up anything dropped (or left half-done by a crash) while we were not running
+    _recover_orphaned_jobs()
+    _scan_for_jobs(job_queue)
+    
+    try:
+        while True:
+            try:
+                job_file = job_queue.get(timeout=RESCAN_INTERVAL)
+            except queue.Empty:
+                # Fallback rescan for files the watcher may have missed
+                _scan_for_jobs(job_queue)
+                continue
+            except KeyboardInterrupt:
+                logger.info("Stopping job processor...")
+                break
+            
+            try:
+                _handle_job_file(automation, job_file)
+            except KeyboardInterrupt:
+                logger.info("Stopping job processor...")
+                break
+            except Exception as e:
+                logger.error(f"Error in job processing loop: {e}")
+                time.sleep(30)
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 # ============================================================================
 # MAIN ENTRY POINT
@@ -10,14 +10,89 @@ import os
 import json
 import time
 import shutil
+import socket
+import socketserver
+import select
+import threading
+import subprocess
+import urllib.request
+import tempfile
+import traceback
+import errno
+import re
+import bisect
+import hashlib
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
+import queue
+import atexit
 import argparse
+import functools
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Fast JSON parsing (optional) - falls back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Filesystem events (optional) - JobWatcher falls back to its own polling loop when missing
+try:
+    from watchdog.observers import Observer  # inotify / FSEvents / ReadDirectoryChangesW
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# HTTP keep-alive for completion webhooks (optional) - falls back to urllib, one connection per call
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# macOS app control via pyobjc (optional) - falls back to spawning open/osascript
+_MINIMIZE_SCRIPT = 'tell application "DaVinci Resolve" to set miniaturized of every window to true'
+try:
+    from AppKit import NSWorkspace
+    from Foundation import NSURL, NSAppleScript
+    _minimize_applescript = NSAppleScript.alloc().initWithSource_(_MINIMIZE_SCRIPT)  # Compiled once
+except ImportError:
+    NSWorkspace = None
+
+# Accessibility API (optional) - minimizes windows directly instead of dispatching Apple Events
+try:
+    from ApplicationServices import (
+        AXIsProcessTrusted, AXUIElementCreateApplication, AXUIElementCopyAttributeValue,
+        AXUIElementSetAttributeValue, kAXWindowsAttribute, kAXMinimizedAttribute,
+    )
+except ImportError:
+    AXIsProcessTrusted = None
+RESOLVE_BUNDLE_IDS = ("com.blackmagic-design.DaVinciResolve", "com.blackmagic-design.DaVinciResolveLite")
 
 # DaVinci Resolve Script API
+# Standard Fusion library locations, narrowed once at import to the ones actually installed
+_FUSION_PATHS = tuple(
+    fusion_path for fusion_path in (
+        "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/",
+        "/Applications/DaVinci Resolve Studio/DaVinci Resolve.app/Contents/Libraries/Fusion/",
+    )
+    if os.path.exists(os.path.join(fusion_path, "fusionscript.so"))
+)
+
+@functools.lru_cache(maxsize=1)
 def load_davinci_api():
     """Load DaVinci Resolve Python API with proper path detection"""
+    if 'DaVinciResolveScript' in sys.modules:
+        return sys.modules['DaVinciResolveScript']
+    
     try:
         import DaVinciResolveScript as dvr
         print("✅ DaVinci Resolve API loaded successfully")
@@ -34,28 +109,21 @@ def load_davinci_api():
                 print(f"Added environment path: {modules_path}")
         
         # Try standard DaVinci paths
-        fusion_paths = [
-            "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/",
-            "/Applications/DaVinci Resolve Studio/DaVinci Resolve.app/Contents/Libraries/Fusion/",
-        ]
-        
-        for fusion_path in fusion_paths:
-            fusionscript_path = os.path.join(fusion_path, "fusionscript.so")
-            if os.path.exists(fusionscript_path):
-                print(f"Found fusionscript.so at: {fusionscript_path}")
-                
-                # Add the Fusion path to Python path
-                if fusion_path not in sys.path:
-                    sys.path.insert(0, fusion_path)
-                
-                # Try to import the DaVinci API
-                try:
-                    import DaVinciResolveScript as dvr
-                    print(f"✅ Successfully loaded DaVinci API from: {fusion_path}")
-                    return dvr
-                except ImportError as e:
-                    print(f"Found fusionscript.so but import failed: {e}")
-                    continue
+        for fusion_path in _FUSION_PATHS:
+            print(f"Found fusionscript.so at: {os.path.join(fusion_path, 'fusionscript.so')}")
+            
+            # Add the Fusion path to Python path
+            if fusion_path not in sys.path:
+                sys.path.insert(0, fusion_path)
+            
+            # Try to import the DaVinci API
+            try:
+                import DaVinciResolveScript as dvr
+                print(f"✅ Successfully loaded DaVinci API from: {fusion_path}")
+                return dvr
+            except ImportError as e:
+                print(f"Found fusionscript.so but import failed: {e}")
+                continue
         
         print("ERROR: DaVinci Resolve Script API not found.")
         print("Please ensure:")
@@ -66,8 +134,14 @@ def load_davinci_api():
         print("5. Environment variables are set: RESOLVE_SCRIPT_API, PYTHONPATH")
         sys.exit(1)
 
-# Load the DaVinci API
-dvr = load_davinci_api()
+_resolve = None  # scriptapp("Resolve") handle shared by every job in this process
+
+def get_resolve(refresh=False):
+    """Return the cached Resolve handle, loading the API and connecting on first use"""
+    global _resolve
+    if _resolve is None or refresh:
+        _resolve = load_davinci_api().scriptapp("Resolve")
+    return _resolve
 
 # ============================================================================
 # CONFIGURATION
@@ -84,55 +158,282 @@ WATCH_FOLDER = BASE_DIR / "queue"  # Folder where jobs are dropped
 OUTPUT_FOLDER = BASE_DIR / "rendered"  # Final rendered videos  
 COMPLETED_FOLDER = BASE_DIR / "completed"  # Processed job files
 
+# Force polling when auto-detection misses a network mount (native file events miss remote writes)
+FORCE_POLLING = os.environ.get('MAGNUMSTREAM_WATCH_POLLING') == '1'
+JOB_SOCKET = BASE_DIR / "davinci.sock"  # Unix socket of the persistent --serve worker
+WATCH_POLL_INTERVAL = 5  # Seconds between folder scans when polling without watchdog
+NETWORK_POLL_INTERVAL = 30  # Seconds between PollingObserver scans on network mounts
+NETWORK_FS_TYPES = {"cifs", "smbfs", "smb3", "nfs", "nfs4", "fuse.sshfs", "osxfuse", "macfuse"}
+JOB_QUEUE_SIZE = 32  # Pending jobs buffered between discovery and rendering
+JOB_READ_BATCH = 16  # Queued job files read concurrently per preparer wakeup
+WATCH_RESCAN_INTERVAL = 60  # Seconds between safety sweeps while file events drive discovery
+JOB_SETTLE_SECONDS = 1.0  # A job file must be unmodified this long before it is read
+COMPLETION_WEBHOOK_URL = os.environ.get('MAGNUMSTREAM_WEBHOOK_URL')  # POSTed after each watched job completes (unset = off)
+
+# Resolve startup: retry connecting with exponential backoff until the timeout
+RESOLVE_STARTUP_TIMEOUT = 30  # Seconds to wait for a freshly launched Resolve
+RESOLVE_RETRY_MIN = 0.1  # First retry delay in seconds
+RESOLVE_RETRY_MAX = 1.0  # Retry delay cap in seconds
+# Local TCP port of Resolve's scripting server; when set, a cheap connect() probe gates the
+# comparatively expensive scriptapp() call while Resolve boots (0 = probe disabled)
+RESOLVE_SCRIPT_PORT = int(os.environ.get('MAGNUMSTREAM_RESOLVE_PORT', '0'))
+
 # Render Settings
 RENDER_PRESET = "YouTube 1080p"  # Name of your render preset in Resolve
 RENDER_FORMAT = "mp4"  # Output format
 RENDER_CODEC = "H.264"  # Video codec
+RENDER_POLL_MIN = 0.5  # Seconds between render status checks right after starting
+RENDER_POLL_MAX = 5.0  # Cap on the status check interval mid-render
+RENDER_LOG_INTERVAL = 30  # Seconds between "still rendering" log lines
+RENDER_EXTENSIONS = (".mp4", ".mov", ".avi")  # Output containers to look for, in order of preference
 
 # Timeline Configuration - Updated for 14-slot MagnumStream template matching MAG_FERRARI
 TIMELINE_NAME = "MAG_FERARRI"  # Name of timeline in your template
+TIMELINE_FRAME_RATE = "23.976"  # Template frame rate, as Resolve's settings expect it
 CLIP_TRACKS = {
     1: "V1",  # Track 1 for all clips (single track template)
 }
 
+class ClipPos(NamedTuple):
+    """Timeline placement of one template slot"""
+    track: int
+    start_frame: int
+
 # Clip Mapping - Maps slot numbers to timeline positions (matches actual timeline structure)
 # Based on actual DaVinci template analysis (debug.log output from get_timeline_clips_debug.lua)
 # All clips are on video track V3 (track index 3)
 # These are the EXACT frame positions from the template timeline
 # 14 slots total: 7 cruising (slots 1-7), 6 chase (slots 8-13), 1 arrival (slot 14)
-CLIP_POSITIONS = {
+CLIP_POSITIONS = MappingProxyType({
     # Cruising Scene (7 slots)
-    1: {"track": 3, "start_frame": 86485},    # Cruising front view, 21 frames (0.876s)
-    2: {"track": 3, "start_frame": 86549},    # Cruising front view, 29 frames (1.210s) → seamless to 3
-    3: {"track": 3, "start_frame": 86578},    # Cruising side view, 31 frames (1.293s)
-    4: {"track": 3, "start_frame": 86631},    # Cruising front view, 23 frames (0.959s) → seamless to 5
-    5: {"track": 3, "start_frame": 86655},    # Cruising side view, 37 frames (1.543s)
-    6: {"track": 3, "start_frame": 86790},    # Cruising front view, 16 frames (0.667s)
-    7: {"track": 3, "start_frame": 86844},    # Cruising side view, 19 frames (0.792s)
+    1: ClipPos(3, 86485),    # Cruising front view, 21 frames (0.876s)
+    2: ClipPos(3, 86549),    # Cruising front view, 29 frames (1.210s) → seamless to 3
+    3: ClipPos(3, 86578),    # Cruising side view, 31 frames (1.293s)
+    4: ClipPos(3, 86631),    # Cruising front view, 23 frames (0.959s) → seamless to 5
+    5: ClipPos(3, 86655),    # Cruising side view, 37 frames (1.543s)
+    6: ClipPos(3, 86790),    # Cruising front view, 16 frames (0.667s)
+    7: ClipPos(3, 86844),    # Cruising side view, 19 frames (0.792s)
 
     # Chase Scene (6 slots)
-    8: {"track": 3, "start_frame": 86905},    # Chase front view, 22 frames (0.918s) → seamless to 9
-    9: {"track": 3, "start_frame": 86927},    # Chase side view, 33 frames (1.376s)
-    10: {"track": 3, "start_frame": 87035},   # Chase front view, 14 frames (0.584s)
-    11: {"track": 3, "start_frame": 87106},   # Chase front view, 36 frames (1.502s) → seamless to 12
-    12: {"track": 3, "start_frame": 87142},   # Chase side view, 34 frames (1.418s)
-    13: {"track": 3, "start_frame": 87216},   # Chase side view, 13 frames (0.542s)
+    8: ClipPos(3, 86905),    # Chase front view, 22 frames (0.918s) → seamless to 9
+    9: ClipPos(3, 86927),    # Chase side view, 33 frames (1.376s)
+    10: ClipPos(3, 87035),   # Chase front view, 14 frames (0.584s)
+    11: ClipPos(3, 87106),   # Chase front view, 36 frames (1.502s) → seamless to 12
+    12: ClipPos(3, 87142),   # Chase side view, 34 frames (1.418s)
+    13: ClipPos(3, 87216),   # Chase side view, 13 frames (0.542s)
 
     # Arrival Scene (1 slot)
-    14: {"track": 3, "start_frame": 87353},   # Arrival side view, 77 frames (3.212s)
-}
+    14: ClipPos(3, 87353),   # Arrival side view, 77 frames (3.212s)
+})
+
+# Column view of CLIP_POSITIONS for hot lookups: index i holds slot CLIP_SLOTS[i]
+CLIP_SLOTS = tuple(sorted(CLIP_POSITIONS))
+CLIP_START_FRAMES = tuple(CLIP_POSITIONS[s].start_frame for s in CLIP_SLOTS)
+
+# Slots grouped by video track as (start_frame, slot) sorted by start, so each track is fetched once
+_SLOTS_BY_TRACK = {}
+for _slot, _pos in CLIP_POSITIONS.items():
+    _SLOTS_BY_TRACK.setdefault(_pos.track, []).append((_pos.start_frame, _slot))
+_SLOTS_BY_TRACK = MappingProxyType({track: tuple(sorted(slots)) for track, slots in sorted(_SLOTS_BY_TRACK.items())})
+del _slot, _pos
+
+# Resolve's API surface is fixed per version: probe each method once per object kind.
+# Every scripting object shares one proxy type, so callers name the kind explicitly
+_API_CAPS = {}
+
+def _has(obj, kind, name):
+    """Cached hasattr/callable probe for a Resolve API object of the given kind"""
+    if obj is None:
+        return False
+    key = (kind, name)
+    supported = _API_CAPS.get(key)
+    if supported is None:
+        supported = callable(getattr(obj, name, None))
+        _API_CAPS[key] = supported
+    return supported
 
 # Logging Configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('davinci_automation.log'),
-        logging.StreamHandler()
-    ]
-)
+# One-shot --job-file processes append straight to the log file; only the long-lived
+# --watch/--serve worker rotates it (see _use_worker_log), since several processes
+# can't safely rotate one file. Callers only enqueue records: a listener thread
+# formats and writes them for both handlers
+LOG_FILE = 'davinci_automation.log'
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler(LOG_FILE)
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener.start()
+
+def _use_worker_log():
+    """Rotate the log file at midnight (7 days kept) and write it in batches; long-lived worker only"""
+    rotating_handler = TimedRotatingFileHandler(LOG_FILE, when='midnight', backupCount=7)
+    rotating_handler.setFormatter(_log_formatter)
+    # Warnings and errors flush at once so they are never held back in the buffer
+    buffered_handler = MemoryHandler(capacity=64, flushLevel=logging.WARNING, target=rotating_handler)
+    _log_listener.stop()  # Drains records already queued into the plain handler
+    _log_file_handler.close()
+    _log_listener.handlers = (buffered_handler, _log_stream_handler)
+    _log_listener.start()
+
+def _flush_log():
+    """Write out any log records still held in a buffer"""
+    for handler in _log_listener.handlers:
+        handler.flush()
+
+atexit.register(_flush_log)
+atexit.register(_log_listener.stop)  # Runs first (atexit is LIFO): drain the queue, then flush
 logger = logging.getLogger(__name__)
 
+# Customer name cleanup: one regex pass per string instead of chained str.replace calls
+_CUSTOMER_NAME_SUBS = {'_Flight': '', ' Flight': '', '___': ' & ', '_&_': '&', '_': ' '}
+_CUSTOMER_NAME_RE = re.compile(r'_Flight| Flight|___|_')
+_SESSION_ID_RE = re.compile(r'_&_|_')
+
+def _customer_name_sub(match):
+    return _CUSTOMER_NAME_SUBS[match.group(0)]
+
+@functools.lru_cache(maxsize=8)
+def _render_output_names(render_filename):
+    """Output file name -> preference rank for render_filename, built once per render"""
+    return MappingProxyType({f"{render_filename}{ext}": rank for rank, ext in enumerate(RENDER_EXTENSIONS)})
+
+def _stat_render_outputs(folder, render_filename):
+    """(path, size, mtime) for each rendered file named render_filename, .mp4 first"""
+    wanted = _render_output_names(render_filename)
+    try:
+        with os.scandir(folder) as entries:
+            found = [(wanted[entry.name], Path(entry.path), entry.stat()) for entry in entries
+                     if entry.name in wanted]
+    except FileNotFoundError:
+        return []
+    found.sort(key=lambda item: item[0])
+    return [(path, st.st_size, st.st_mtime) for _, path, st in found]
+
+# Index atoms encoders append when they close the file: MP4/MOV 'moov' and the AVI 'idx1' chunk.
+# Only the tail is checked: a fragmented MP4 carries a 'moov' at the front while still being written
+_CONTAINER_INDEX = {'.mp4': b'moov', '.mov': b'moov', '.avi': b'idx1'}
+CONTAINER_PROBE_BYTES = 65536  # Bytes read from the end of a render output to look for its index
+
+def _container_finalized(path, size):
+    """True if the render output already ends with its closing index (one pread, no waiting)"""
+    marker = _CONTAINER_INDEX.get(path.suffix.lower())
+    if marker is None:
+        return False
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        # No marker just means "unknown" (e.g. a faststart file): callers fall back to the growth check
+        return marker in os.pread(fd, CONTAINER_PROBE_BYTES, max(0, size - CONTAINER_PROBE_BYTES))
+    finally:
+        os.close(fd)
+
+def _resolve_pid():
+    """PID of the running Resolve app, or None if it can't be found"""
+    if NSWorkspace is not None:
+        for app in NSWorkspace.sharedWorkspace().runningApplications():
+            if app.bundleIdentifier() in RESOLVE_BUNDLE_IDS:
+                return app.processIdentifier()
+        return None
+    try:
+        pids = subprocess.run(['pgrep', '-x', 'Resolve'], capture_output=True, text=True, timeout=5).stdout.split()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return int(pids[0]) if pids else None
+
+def _watch_process_exit(pid, on_exit, timeout):
+    """Call on_exit from a daemon thread if pid exits within timeout seconds (None waits for good;
+    pidfd on Linux, kqueue on macOS); returns False when neither is available"""
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            return False
+        def wait_for_exit():
+            try:
+                exited = select.select([fd], [], [], timeout)[0]
+            finally:
+                os.close(fd)
+            if exited:
+                on_exit()
+    elif hasattr(select, 'kqueue'):
+        kq = select.kqueue()
+        try:
+            kq.control([select.kevent(pid, select.KQ_FILTER_PROC, select.KQ_EV_ADD, select.KQ_NOTE_EXIT)], 0, 0)
+        except OSError:
+            kq.close()
+            return False
+        def wait_for_exit():
+            try:
+                exited = kq.control(None, 1, timeout)
+            finally:
+                kq.close()
+            if exited:
+                on_exit()
+    else:
+        return False
+    threading.Thread(target=wait_for_exit, name="resolve-exit-watch", daemon=True).start()
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _compiled_minimize_script():
+    """Path of _MINIMIZE_SCRIPT compiled by osacompile (reused across runs), or None if unavailable"""
+    # Named after the source so an edited script never runs a stale compile
+    digest = hashlib.sha1(_MINIMIZE_SCRIPT.encode('utf-8')).hexdigest()[:12]
+    compiled = Path(tempfile.gettempdir()) / f"magnumstream_minimize_{digest}.scpt"
+    if not compiled.exists():
+        try:
+            subprocess.run(['osacompile', '-o', str(compiled), '-e', _MINIMIZE_SCRIPT],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10, check=True)
+        except (OSError, subprocess.SubprocessError):
+            return None
+    return str(compiled)
+
+def _port_open(port):
+    """True once something accepts TCP connections on localhost:port"""
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=RESOLVE_RETRY_MIN):
+            return True
+    except OSError:
+        return False
+
+def _list_dir_names(directory):
+    """Return the entry names in a directory (empty if it can't be read)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def _clip_files_present(clip_paths):
+    """True/False per clip path, from one directory read per folder instead of a stat per clip"""
+    split_paths = [os.path.split(clip_path) for clip_path in clip_paths]
+    # Folders are read concurrently since each read can cost a round trip on a network share
+    parents = list(dict.fromkeys(parent or "." for parent, _ in split_paths))
+    if len(parents) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(parents))) as pool:
+            dir_listings = dict(zip(parents, pool.map(_list_dir_names, parents)))
+    else:
+        dir_listings = {parent: _list_dir_names(parent) for parent in parents}
+    return [name in dir_listings[parent or "."] for parent, name in split_paths]
+
+def _find_render_outputs(folder, render_filename):
+    """Rendered files named render_filename, found with one directory read (.mp4 first)"""
+    wanted = _render_output_names(render_filename)
+    try:
+        with os.scandir(folder) as entries:
+            found = [entry.path for entry in entries if entry.name in wanted]
+    except FileNotFoundError:
+        return []
+    found.sort(key=lambda path: wanted[os.path.basename(path)])
+    return [Path(path) for path in found]
+
 # ============================================================================
 # MAIN AUTOMATION CLASS
 # ============================================================================
@@ -146,6 +447,23 @@ class DaVinciAutomation:
         self.media_pool = None
         self.timeline = None
         self.working_copy_name = None  # Track working copy for cleanup
+        self._track_cache = {}  # Video track -> (items, starts) of the unmodified template timeline
+        self._track_cache_timeline = None  # Timeline the cached tracks belong to
+        self._item_media_cache = {}  # id(template item) -> (media_pool_item, clip_name)
+        self._delete_all_render_jobs = None  # current_project.DeleteAllRenderJobs, bound per render
+
+        # Clip replacement strategies, tried in order for each slot
+        self._replacement_chain = (
+            self._replace_via_add_take,
+            self._replace_via_timeline_replace_clip,
+            self._replace_via_delete_and_add,
+            self._replace_via_media_pool_replace_clip,
+        )
+        self._add_take_signature = 0  # Index of the AddTake signature that last worked
+        self._render_codec = None  # MP4 codec name SetCurrentRenderFormatAndCodec accepted last time
+        self._resolve_exit_pid = None  # Resolve PID the exit watch is attached to (one watch per instance)
+        self._resolve_exited = threading.Event()  # Set when that Resolve process exits
+        self._render_wakeup = threading.Event()  # Wait event of the current render, also woken on exit
 
         self._connect_to_resolve()
     
@@ -153,12 +471,13 @@ class DaVinciAutomation:
         """Establish connection to DaVinci Resolve"""
         try:
             # Try to connect to existing DaVinci instance
-            self.resolve = dvr.scriptapp("Resolve")
+            self.resolve = get_resolve()
+            if self.resolve and not self.resolve.GetProjectManager():
+                # Cached handle outlived the Resolve instance it was bound to
+                self.resolve = get_resolve(refresh=True)
             if not self.resolve:
                 logger.info("DaVinci Resolve not detected, attempting to start it...")
                 # Try to launch DaVinci Resolve quietly
-                import subprocess
-                import time
                 
                 # Launch DaVinci Resolve in background (it will still show but minimized)
                 davinci_paths = [
@@ -166,20 +485,42 @@ class DaVinciAutomation:
                     "/Applications/DaVinci Resolve Studio/DaVinci Resolve.app"
                 ]
                 
-                for app_path in davinci_paths:
-                    if Path(app_path).exists():
-                        logger.info(f"Starting DaVinci Resolve from: {app_path}")
+                app_path = next((p for p in davinci_paths if Path(p).is_dir()), None)
+                if app_path:
+                    logger.info("Starting DaVinci Resolve from: %s", app_path)
+                    if NSWorkspace is not None:
+                        # Launch in background without stealing focus (NSWorkspaceLaunchWithoutActivation)
+                        NSWorkspace.sharedWorkspace().launchApplicationAtURL_options_configuration_error_(
+                            NSURL.fileURLWithPath_(app_path), 1 << 9, {}, None)
+                    else:
                         # Use 'open -g' to launch in background without stealing focus
                         subprocess.Popen(['open', '-g', app_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        break
                 
-                # Wait for DaVinci to start and retry connection
-                for attempt in range(30):  # Wait up to 30 seconds
-                    time.sleep(1)
-                    self.resolve = dvr.scriptapp("Resolve")
-                    if self.resolve:
+                elif _resolve_pid() is None:
+                    raise Exception("DaVinci Resolve is not installed in /Applications and is not running")
+                
+                # Wait for DaVinci to start, retrying quickly at first and backing off
+                deadline = time.monotonic() + RESOLVE_STARTUP_TIMEOUT
+                delay = RESOLVE_RETRY_MIN
+                attempt = 0
+                seen_pid = None
+                while time.monotonic() < deadline:
+                    time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+                    if not RESOLVE_SCRIPT_PORT or _port_open(RESOLVE_SCRIPT_PORT):
+                        self.resolve = get_resolve(refresh=True)
+                        if self.resolve:
+                            break
+                    # Stop waiting out the full timeout if Resolve quits (or crashes) while starting
+                    pid = _resolve_pid()
+                    if pid:
+                        seen_pid = pid
+                    elif seen_pid:
+                        logger.warning("DaVinci Resolve exited while starting up")
                         break
-                    logger.info(f"Waiting for DaVinci Resolve to start... ({attempt + 1}/30)")
+                    attempt += 1
+                    delay = min(delay * 1.5, RESOLVE_RETRY_MAX)
+                    if delay == RESOLVE_RETRY_MAX:
+                        logger.info("Waiting for DaVinci Resolve to start... (attempt %s)", attempt)
                 
                 if not self.resolve:
                     raise Exception("Could not connect to DaVinci Resolve after startup attempt")
@@ -190,18 +531,59 @@ class DaVinciAutomation:
             
             # Try to minimize DaVinci Resolve window to keep focus on dashboard
             try:
-                import subprocess
-                subprocess.run(['osascript', '-e', 'tell application "DaVinci Resolve" to set miniaturized of every window to true'], 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                if self._minimize_via_accessibility():
+                    pass
+                elif NSWorkspace is not None:
+                    _, error = _minimize_applescript.executeAndReturnError_(None)
+                    if error:
+                        raise RuntimeError(error)
+                else:
+                    # Cosmetic only - don't wait for osascript to finish
+                    compiled = _compiled_minimize_script()
+                    subprocess.Popen(['osascript', compiled] if compiled else ['osascript', '-e', _MINIMIZE_SCRIPT],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
                 logger.info("Minimized DaVinci Resolve windows")
             except:
                 logger.info("Could not minimize DaVinci Resolve (this is normal)")
             
             logger.info("Successfully connected to DaVinci Resolve")
+            self._watch_resolve_exit()
         except Exception as e:
-            logger.error(f"Failed to connect to DaVinci Resolve: {e}")
+            logger.error("Failed to connect to DaVinci Resolve: %s", e)
             logger.error("Please ensure DaVinci Resolve Studio is installed and scripting is enabled")
-            sys.exit(1)
+            # Raised, not sys.exit: a reconnect from a long-lived worker fails the job, not the process
+            raise
+    
+    def _watch_resolve_exit(self):
+        """Attach one exit watch to the connected Resolve process, shared by every render"""
+        pid = _resolve_pid()
+        if pid is None or pid == self._resolve_exit_pid:
+            return
+        exited = threading.Event()
+        def on_exit():
+            exited.set()
+            self._render_wakeup.set()
+        # No timeout: the watch thread lives exactly as long as this Resolve instance
+        if _watch_process_exit(pid, on_exit, None):
+            self._resolve_exit_pid = pid
+            self._resolve_exited = exited
+    
+    def _minimize_via_accessibility(self):
+        """Minimize Resolve's windows through the Accessibility API; False if unavailable"""
+        # Without Accessibility permission the calls fail silently, so let the caller fall back
+        if AXIsProcessTrusted is None or NSWorkspace is None or not AXIsProcessTrusted():
+            return False
+        apps = [app for app in NSWorkspace.sharedWorkspace().runningApplications()
+                if app.bundleIdentifier() in RESOLVE_BUNDLE_IDS]
+        if not apps:
+            return False
+        element = AXUIElementCreateApplication(apps[0].processIdentifier())
+        error, windows = AXUIElementCopyAttributeValue(element, kAXWindowsAttribute, None)
+        if error:
+            return False
+        for window in windows or ():
+            AXUIElementSetAttributeValue(window, kAXMinimizedAttribute, True)
+        return True
     
     def process_job(self, job_data):
         """Main processing function for a single job (updated for MagnumStream workflow)"""
@@ -210,15 +592,26 @@ class DaVinciAutomation:
             clips = job_data['clips']
             recording_id = job_data.get('recordingId', job_data.get('jobId'))
             
-            logger.info(f"Starting DaVinci processing for project: {project_name}")
-            logger.info(f"Recording ID: {recording_id}")
-            logger.info(f"Processing {len(clips)} clips")
+            logger.info("Starting DaVinci processing for project: %s", project_name)
+            logger.info("Recording ID: %s", recording_id)
+            logger.info("Processing %s clips", len(clips))
             
             # Debug: Show which slots are in the job file
             slot_numbers = list(clips.keys())
-            logger.info(f"📋 Clips in job file: slots {slot_numbers}")
+            logger.info("📋 Clips in job file: slots %s", slot_numbers)
             for slot_num, clip_info in clips.items():
-                logger.info(f"   Slot {slot_num}: {clip_info.get('filename', 'No filename')} ({clip_info.get('duration', 'No duration')}s)")
+                logger.info("   Slot %s: %s (%ss)", slot_num, clip_info.get('filename', 'No filename'), clip_info.get('duration', 'No duration'))
+            
+            # A long-lived worker (--watch/--serve) can outlive the Resolve instance it connected to
+            try:
+                project_manager = self.resolve.GetProjectManager() if self.resolve else None
+            except Exception:
+                project_manager = None
+            if project_manager:
+                self.project_manager = project_manager
+            else:
+                logger.info("Lost connection to DaVinci Resolve, reconnecting...")
+                self._connect_to_resolve()
             
             # Load template project
             if not self._load_template_project():
@@ -231,14 +624,15 @@ class DaVinciAutomation:
                 return False
 
             # DEBUG: Log template state IMMEDIATELY after load, before ANY modifications
-            logger.info("🔍 DEBUG: Template state immediately after loading (before any changes):")
-            track_index = 3
-            debug_items = self.timeline.GetItemListInTrack('video', track_index)
-            for item in debug_items:
-                start = item.GetStart()
-                media = item.GetMediaPoolItem()
-                name = media.GetName() if media else "NO MEDIA"
-                logger.info(f"   Frame {start}: '{name}'")
+            # (three Resolve calls per item, so only when debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 DEBUG: Template state immediately after loading (before any changes):")
+                track_index = 3
+                debug_items, debug_starts = self._template_track(track_index)
+                for item, start in zip(debug_items, debug_starts):
+                    media = item.GetMediaPoolItem()
+                    name = media.GetName() if media else "NO MEDIA"
+                    logger.debug("   Frame %s: '%s'", start, name)
 
             # Import and replace clips using existing project structure
             if not self._replace_clips_from_project(clips, recording_id):
@@ -253,7 +647,7 @@ class DaVinciAutomation:
             if not output_path:
                 return False
 
-            logger.info(f"Successfully completed DaVinci render: {output_path}")
+            logger.info("Successfully completed DaVinci render: %s", output_path)
 
             # CRITICAL: Close project WITHOUT saving after render
             # This discards all in-memory changes (takes, etc.) so the template
@@ -266,7 +660,7 @@ class DaVinciAutomation:
             return output_path
 
         except Exception as e:
-            logger.error(f"Error processing DaVinci job: {e}")
+            logger.error("Error processing DaVinci job: %s", e)
             # Also close without saving on error
             self._close_project_without_saving()
             return False
@@ -283,7 +677,7 @@ class DaVinciAutomation:
             existing_projects = self.project_manager.GetProjectListInCurrentFolder()
             for proj_name in existing_projects:
                 if proj_name.startswith("_WORKING_"):
-                    logger.info(f"🗑️ Deleting old working copy: {proj_name}")
+                    logger.info("🗑️ Deleting old working copy: %s", proj_name)
                     try:
                         self.project_manager.DeleteProject(proj_name)
                     except:
@@ -294,7 +688,7 @@ class DaVinciAutomation:
             if not template_project:
                 raise Exception(f"Could not load template project: {TEMPLATE_PROJECT_NAME}")
 
-            logger.info(f"✅ Loaded template project: {TEMPLATE_PROJECT_NAME}")
+            logger.info("✅ Loaded template project: %s", TEMPLATE_PROJECT_NAME)
 
             # CRITICAL: Create a TRUE copy via export/import to preserve the original template
             # MediaPoolItem.ReplaceClip writes directly to DaVinci's database,
@@ -303,10 +697,9 @@ class DaVinciAutomation:
 
             # Try export/import approach for a true copy
             try:
-                import tempfile
                 export_path = Path(tempfile.gettempdir()) / f"{working_name}.drp"
 
-                logger.info(f"📦 Exporting template to create working copy...")
+                logger.info("📦 Exporting template to create working copy...")
 
                 # Export the template project
                 export_result = self.project_manager.ExportProject(
@@ -316,7 +709,7 @@ class DaVinciAutomation:
                 )
 
                 if export_result and export_path.exists():
-                    logger.info(f"✅ Template exported to: {export_path}")
+                    logger.info("✅ Template exported to: %s", export_path)
 
                     # Close the template (we don't want to modify it)
                     self.project_manager.CloseProject(template_project)
@@ -328,7 +721,7 @@ class DaVinciAutomation:
                         # Load the imported working copy
                         self.current_project = self.project_manager.LoadProject(working_name)
                         if self.current_project:
-                            logger.info(f"✅ Created isolated working copy: {working_name}")
+                            logger.info("✅ Created isolated working copy: %s", working_name)
                             self.working_copy_name = working_name
                         else:
                             raise Exception("Could not load imported working copy")
@@ -344,10 +737,10 @@ class DaVinciAutomation:
                     raise Exception(f"ExportProject failed or file not created")
 
             except Exception as copy_error:
-                logger.warning(f"⚠️ Export/Import copy failed: {copy_error}")
-                logger.warning(f"   Falling back to direct template usage")
-                logger.warning(f"   ⚠️ MediaPoolItem.ReplaceClip WILL modify the template!")
-                logger.warning(f"   You may need to restore from backup after this render.")
+                logger.warning("⚠️ Export/Import copy failed: %s", copy_error)
+                logger.warning("   Falling back to direct template usage")
+                logger.warning("   ⚠️ MediaPoolItem.ReplaceClip WILL modify the template!")
+                logger.warning("   You may need to restore from backup after this render.")
 
                 self.working_copy_name = None
 
@@ -367,7 +760,7 @@ class DaVinciAutomation:
 
             # Get the timeline - with debugging
             timeline_count = self.current_project.GetTimelineCount()
-            logger.info(f"Found {timeline_count} timelines in project")
+            logger.info("Found %s timelines in project", timeline_count)
 
             # List all available timelines for debugging
             available_timelines = []
@@ -375,23 +768,23 @@ class DaVinciAutomation:
                 timeline = self.current_project.GetTimelineByIndex(i)
                 timeline_name = timeline.GetName()
                 available_timelines.append(timeline_name)
-                logger.info(f"Timeline {i}: '{timeline_name}'")
+                logger.info("Timeline %s: '%s'", i, timeline_name)
 
                 # Try to match the expected timeline name
                 if timeline_name == TIMELINE_NAME:
                     self.timeline = timeline
                     self.current_project.SetCurrentTimeline(timeline)
-                    logger.info(f"Using timeline: {timeline_name}")
+                    logger.info("Using timeline: %s", timeline_name)
                     break
 
             # If no exact match, use the first timeline as fallback
             if not self.timeline and timeline_count > 0:
-                logger.warning(f"Timeline '{TIMELINE_NAME}' not found. Available timelines: {available_timelines}")
+                logger.warning("Timeline '%s' not found. Available timelines: %s", TIMELINE_NAME, available_timelines)
                 logger.info("Using first timeline as fallback...")
                 self.timeline = self.current_project.GetTimelineByIndex(1)
                 self.current_project.SetCurrentTimeline(self.timeline)
                 actual_name = self.timeline.GetName()
-                logger.info(f"Using timeline: '{actual_name}'")
+                logger.info("Using timeline: '%s'", actual_name)
 
             if not self.timeline:
                 raise Exception(f"No timelines found in project. Available: {available_timelines}")
@@ -400,44 +793,64 @@ class DaVinciAutomation:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to load template project: {e}")
+            logger.error("Failed to load template project: %s", e)
             return False
 
+    def _template_track(self, track):
+        """(items, starts) of a template video track, fetched once until the timeline changes"""
+        if self._track_cache_timeline is not self.timeline:
+            self._track_cache_timeline = self.timeline
+            self._track_cache = {}
+            self._item_media_cache = {}
+        cached = self._track_cache.get(track)
+        if cached is None:
+            items = self.timeline.GetItemListInTrack('video', track) or []
+            cached = (items, [item.GetStart() for item in items])
+            self._track_cache[track] = cached
+        return cached
+    
+    def _template_item_media(self, item):
+        """(media_pool_item, clip_name) of an item from _template_track, fetched once per snapshot"""
+        cached = self._item_media_cache.get(id(item))  # Items stay alive in _track_cache, so ids are stable
+        if cached is None:
+            media_pool_item = item.GetMediaPoolItem()
+            clip_name = media_pool_item.GetName() if media_pool_item and _has(media_pool_item, 'MediaPoolItem', 'GetName') \
+                else "Unknown"
+            cached = (media_pool_item, clip_name)
+            self._item_media_cache[id(item)] = cached
+        return cached
+    
     def _verify_template_integrity(self):
         """Verify all 14 expected clip positions exist AND have unique media pool items"""
         try:
             logger.info("🔍 Verifying template integrity (checking for all 14 expected slots)...")
 
             track_index = 3  # All clips should be on track V3
-            timeline_items = self.timeline.GetItemListInTrack('video', track_index)
+            timeline_items, item_starts = self._template_track(track_index)
 
             if not timeline_items:
-                logger.error(f"❌ No items found on track V{track_index}")
+                logger.error("❌ No items found on track V%s", track_index)
                 return False
 
-            logger.info(f"   Found {len(timeline_items)} items on track V{track_index}")
+            logger.info("   Found %s items on track V%s", len(timeline_items), track_index)
 
-            # Get all start frames from timeline
-            actual_frames = set()
-            for item in timeline_items:
-                start = item.GetStart()
-                if start is not None:
-                    actual_frames.add(start)
+            # Start frames come with the track snapshot (one GetStart per item, reused below)
+            actual_frames = {start for start in item_starts if start is not None}
 
             # Check each expected position
-            expected_frames = {pos['start_frame'] for pos in CLIP_POSITIONS.values()}
+            expected_frames = set(CLIP_START_FRAMES)
             missing_frames = expected_frames - actual_frames
             extra_frames = actual_frames - expected_frames
 
             if missing_frames:
-                logger.error(f"❌ Template is missing clips at these frame positions:")
+                logger.error("❌ Template is missing clips at these frame positions:")
                 for slot_num, pos in CLIP_POSITIONS.items():
-                    if pos['start_frame'] in missing_frames:
-                        logger.error(f"   Slot {slot_num}: frame {pos['start_frame']} NOT FOUND")
+                    if pos.start_frame in missing_frames:
+                        logger.error("   Slot %s: frame %s NOT FOUND", slot_num, pos.start_frame)
                 return False
 
             if extra_frames:
-                logger.warning(f"⚠️ Template has unexpected clips at frames: {sorted(extra_frames)}")
+                logger.warning("⚠️ Template has unexpected clips at frames: %s", sorted(extra_frames))
                 logger.warning("   This may be okay, but template might have been modified")
 
             # CRITICAL: Verify each slot has a UNIQUE media pool item
@@ -448,18 +861,16 @@ class DaVinciAutomation:
             frame_to_clip_name = {}
             media_id_to_frames = {}  # Track which frames use each media ID
 
-            for item in timeline_items:
-                start_frame = item.GetStart()
+            for item, start_frame in zip(timeline_items, item_starts):
                 if start_frame not in expected_frames:
                     continue
 
-                media_pool_item = item.GetMediaPoolItem()
+                media_pool_item, clip_name = self._template_item_media(item)
                 if not media_pool_item:
-                    logger.error(f"❌ No media pool item at frame {start_frame}")
+                    logger.error("❌ No media pool item at frame %s", start_frame)
                     return False
 
-                clip_name = media_pool_item.GetName() if hasattr(media_pool_item, 'GetName') else "Unknown"
-                media_id = media_pool_item.GetMediaId() if hasattr(media_pool_item, 'GetMediaId') else str(id(media_pool_item))
+                media_id = media_pool_item.GetMediaId() if _has(media_pool_item, 'MediaPoolItem', 'GetMediaId') else str(id(media_pool_item))
 
                 frame_to_media_id[start_frame] = media_id
                 frame_to_clip_name[start_frame] = clip_name
@@ -472,32 +883,31 @@ class DaVinciAutomation:
             shared_media = {mid: frames for mid, frames in media_id_to_frames.items() if len(frames) > 1}
 
             if shared_media:
-                logger.error(f"❌ CRITICAL: Template has SHARED media pool items!")
-                logger.error(f"   MediaPoolItem.ReplaceClip will corrupt the timeline.")
-                logger.error(f"   Each slot position needs a UNIQUE media pool item.")
+                logger.error("❌ CRITICAL: Template has SHARED media pool items!")
+                logger.error("   MediaPoolItem.ReplaceClip will corrupt the timeline.")
+                logger.error("   Each slot position needs a UNIQUE media pool item.")
                 for media_id, frames in shared_media.items():
-                    slot_nums = [s for s, p in CLIP_POSITIONS.items() if p['start_frame'] in frames]
+                    slot_nums = [s for s, p in CLIP_POSITIONS.items() if p.start_frame in frames]
                     clip_name = frame_to_clip_name.get(frames[0], "Unknown")
-                    logger.error(f"   Media '{clip_name}' (ID: {media_id}) is used at slots: {slot_nums}")
-                logger.error(f"")
-                logger.error(f"   To fix: In DaVinci, ensure each slot has a separate clip in the Media Pool.")
-                logger.error(f"   You may need to duplicate clips or re-import them individually.")
+                    logger.error("   Media '%s' (ID: %s) is used at slots: %s", clip_name, media_id, slot_nums)
+                logger.error("")
+                logger.error("   To fix: In DaVinci, ensure each slot has a separate clip in the Media Pool.")
+                logger.error("   You may need to duplicate clips or re-import them individually.")
                 return False
 
             # Log the slot-to-clip mapping
-            logger.info(f"✅ All 14 slots have unique media pool items:")
+            logger.info("✅ All 14 slots have unique media pool items:")
             for slot_num, pos in sorted(CLIP_POSITIONS.items()):
-                frame = pos['start_frame']
+                frame = pos.start_frame
                 clip_name = frame_to_clip_name.get(frame, "Unknown")
-                logger.info(f"   Slot {slot_num} (frame {frame}): '{clip_name}'")
+                logger.info("   Slot %s (frame %s): '%s'", slot_num, frame, clip_name)
 
-            logger.info(f"✅ Template integrity verified: All 14 expected slots found with unique media")
+            logger.info("✅ Template integrity verified: All 14 expected slots found with unique media")
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to verify template integrity: {e}")
-            import traceback
+            logger.error("Failed to verify template integrity: %s", e)
             logger.error(traceback.format_exc())
             return False
 
@@ -509,8 +919,8 @@ class DaVinciAutomation:
             # Critical settings from working project configuration
             project_settings = {
                 # Timeline settings - must match template
-                "timelineFrameRate": "23.976",
-                "timelinePlaybackFrameRate": "23.976",
+                "timelineFrameRate": TIMELINE_FRAME_RATE,
+                "timelinePlaybackFrameRate": TIMELINE_FRAME_RATE,
                 "timelineResolutionWidth": "1920",
                 "timelineResolutionHeight": "1080",
                 "timelineOutputResolutionWidth": "1920",
@@ -541,37 +951,49 @@ class DaVinciAutomation:
                 "videoDataLevels": "Video",
             }
 
+            # Read every current setting in one call (GetSetting with no key returns them all)
+            # so only values that actually differ cost a SetSetting round-trip
+            try:
+                current = self.current_project.GetSetting() or {}
+            except Exception:
+                current = {}
+            pending = {key: value for key, value in project_settings.items()
+                       if str(current.get(key)) != value}
+            if not pending:
+                logger.info("Project settings already match, nothing to apply")
+                return
+
             # Apply settings one by one with error handling
             settings_applied = 0
             settings_failed = 0
+            can_set = _has(self.current_project, 'Project', 'SetSetting')
 
-            for key, value in project_settings.items():
+            for key, value in pending.items():
                 try:
-                    if hasattr(self.current_project, 'SetSetting'):
+                    if can_set:
                         result = self.current_project.SetSetting(key, value)
                         if result:
                             settings_applied += 1
-                            logger.debug(f"✅ Set {key} = {value}")
+                            logger.debug("✅ Set %s = %s", key, value)
                         else:
                             settings_failed += 1
-                            logger.debug(f"⚠️ Could not set {key} = {value}")
+                            logger.debug("⚠️ Could not set %s = %s", key, value)
                 except Exception as e:
                     settings_failed += 1
-                    logger.debug(f"❌ Error setting {key}: {e}")
+                    logger.debug("❌ Error setting %s: %s", key, e)
 
-            logger.info(f"Project settings: {settings_applied} applied, {settings_failed} failed/skipped")
+            logger.info("Project settings: %s applied, %s failed/skipped, %s already set",
+                        settings_applied, settings_failed, len(project_settings) - len(pending))
             logger.info("Note: Some settings may be template-locked or require different API calls")
 
         except Exception as e:
-            logger.warning(f"Could not configure all project settings: {e}")
+            logger.warning("Could not configure all project settings: %s", e)
             logger.info("Continuing with template default settings")
 
-    def _cleanup_old_clip_bins(self):
+    def _cleanup_old_clip_bins(self, root_folder):
         """Remove old Clips_* bins from previous renders to prevent media pool pollution"""
         try:
             logger.info("🧹 Cleaning up old clip bins from previous renders...")
-            root_folder = self.media_pool.GetRootFolder()
-
             if not root_folder:
                 logger.warning("Could not access root folder for cleanup")
                 return
@@ -587,9 +1009,9 @@ class DaVinciAutomation:
                 folder_name = folder.GetName()
                 # Match folders created by previous renders (Clips_* pattern)
                 if folder_name.startswith("Clips_"):
-                    logger.info(f"   Removing old bin: {folder_name}")
-                    # Delete all clips in the bin first
-                    self.media_pool.SetCurrentFolder(folder)
+                    logger.info("   Removing old bin: %s", folder_name)
+                    # Delete all clips in the bin first (DeleteClips takes the items, the bin
+                    # doesn't need to be the current folder)
                     clips_in_folder = folder.GetClipList()
                     if clips_in_folder:
                         self.media_pool.DeleteClips(clips_in_folder)
@@ -597,112 +1019,145 @@ class DaVinciAutomation:
                     self.media_pool.DeleteFolders([folder])
                     bins_removed += 1
 
-            logger.info(f"🧹 Cleanup complete: removed {bins_removed} old bin(s)")
-            # Reset to root folder
-            self.media_pool.SetCurrentFolder(root_folder)
+            logger.info("🧹 Cleanup complete: removed %s old bin(s)", bins_removed)
+            # Reset to root folder in case the current folder was one of the deleted bins
+            if bins_removed:
+                self.media_pool.SetCurrentFolder(root_folder)
 
         except Exception as e:
-            logger.warning(f"Could not clean up old bins: {e}")
+            logger.warning("Could not clean up old bins: %s", e)
             logger.info("Continuing without cleanup")
 
     def _replace_clips_from_project(self, clips, recording_id):
         """Replace placeholder clips with new recordings using media pool replacement strategy"""
         try:
             # CRITICAL: Clean up old imported clips from previous renders
-            self._cleanup_old_clip_bins()
+            root_folder = self.media_pool.GetRootFolder()
+            self._cleanup_old_clip_bins(root_folder)
 
             # Create a new bin for this project's clips
-            root_folder = self.media_pool.GetRootFolder()
             clip_bin = self.media_pool.AddSubFolder(root_folder, f"Clips_{recording_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
             self.media_pool.SetCurrentFolder(clip_bin)
 
-            logger.info(f"📦 Importing {len(clips)} clips to media pool...")
+            logger.info("📦 Importing %s clips to media pool...", len(clips))
 
             # STEP 1: Import all new clips to media pool first
-            imported_clips = {}  # slot_number -> media_pool_item
-            for slot_num, clip_info in clips.items():
+            valid_slots = []  # (slot_number, clip_path, clip_info) for clips present on disk
+            # Plain strings all the way to ImportMedia - no Path round-trip needed
+            job_paths = [os.fspath(clip_info['fullPath']) for clip_info in clips.values()]
+            for (slot_num, clip_info), clip_path, present in zip(clips.items(), job_paths, _clip_files_present(job_paths)):
                 slot_number = int(slot_num)
-                clip_path = Path(clip_info['fullPath'])
-
-                if not clip_path.exists():
-                    logger.error(f"❌ Clip file not found for slot {slot_number}: {clip_path}")
+                if not present:
+                    logger.error("❌ Clip file not found for slot %s: %s", slot_number, clip_path)
                     continue
+                valid_slots.append((slot_number, clip_path, clip_info))
+
+            # Import every clip with a single ImportMedia call; a file used by several slots is imported once
+            clip_paths = list(dict.fromkeys(clip_path for _, clip_path, _ in valid_slots))
+            imported = (self.media_pool.ImportMedia(clip_paths) if clip_paths else None) or []
+            # ImportMedia doesn't promise argument order, so every item is matched on its file path
+            item_by_path = {item.GetClipProperty("File Path"): item for item in imported}
+            missing = [clip_path for clip_path in clip_paths if clip_path not in item_by_path]
+            if missing:
+                # Retry the missing clips together, one at a time only if that batch fails too
+                retried = self.media_pool.ImportMedia(missing) or []
+                item_by_path.update((item.GetClipProperty("File Path"), item) for item in retried)
+                for clip_path in missing:
+                    if clip_path not in item_by_path:
+                        retry = self.media_pool.ImportMedia([clip_path])
+                        if retry:
+                            item_by_path[clip_path] = retry[0]
 
-                # Import clip to media pool
-                imported = self.media_pool.ImportMedia([str(clip_path)])
-                if imported and len(imported) > 0:
+            imported_clips = {}  # slot_number -> media_pool_item
+            for slot_number, clip_path, clip_info in valid_slots:
+                media_item = item_by_path.get(clip_path)
+                if media_item:
                     imported_clips[slot_number] = {
-                        'media_item': imported[0],
+                        'media_item': media_item,
                         'clip_info': clip_info,
-                        'path': str(clip_path)
+                        'path': clip_path
                     }
-                    logger.info(f"✅ Imported slot {slot_number}: {clip_info['filename']}")
+                    logger.info("✅ Imported slot %s: %s", slot_number, clip_info['filename'])
                 else:
-                    logger.error(f"❌ Failed to import slot {slot_number}: {clip_path}")
+                    logger.error("❌ Failed to import slot %s: %s", slot_number, clip_path)
 
             if len(imported_clips) == 0:
                 logger.error("❌ No clips were imported successfully!")
                 return False
 
-            logger.info(f"📦 Successfully imported {len(imported_clips)}/{len(clips)} clips")
+            logger.info("📦 Successfully imported %s/%s clips", len(imported_clips), len(clips))
 
             # STEP 2: DYNAMIC ANALYSIS - Scan V3 track and map by FRAME POSITION
             # The template reuses media pool clips, so we must use frame positions (which are unique)
             # to identify which timeline position corresponds to which slot number
             track_index = 3  # All clips are on track V3
-            timeline_items = self.timeline.GetItemListInTrack('video', track_index)
-            logger.info(f"🔍 Found {len(timeline_items)} items on video track V{track_index}")
+            timeline_items, _ = self._template_track(track_index)
+            logger.info("🔍 Found %s items on video track V%s", len(timeline_items), track_index)
 
             # VALIDATION: We expect exactly 14 slots on V3 (warmup clips should be on V1, NOT V2)
             # V2 is reserved for the main background video
             if len(timeline_items) < 14:
-                logger.warning(f"⚠️ Expected 14 timeline items on V3 but found {len(timeline_items)}")
-                logger.warning(f"   Template may have missing clips")
+                logger.warning("⚠️ Expected 14 timeline items on V3 but found %s", len(timeline_items))
+                logger.warning("   Template may have missing clips")
             elif len(timeline_items) == 14:
-                logger.info(f"✅ Found 14 timeline items on V3 (warmup clips should be on V1 only)")
+                logger.info("✅ Found 14 timeline items on V3 (warmup clips should be on V1 only)")
             else:
-                logger.warning(f"⚠️ Found {len(timeline_items)} items on V3, expected 14")
-
-            # Build frame_position -> timeline_item mapping
-            frame_to_item = {}
-            logger.info(f"📊 Analyzing timeline clips on V{track_index}:")
-            for item in timeline_items:
-                start_frame = item.GetStart()
-                media_pool_item = item.GetMediaPoolItem()
-                clip_name = media_pool_item.GetName() if media_pool_item else "Unknown"
-                frame_to_item[start_frame] = {
-                    'item': item,
-                    'media_pool_item': media_pool_item,
-                    'clip_name': clip_name,
-                    'start_frame': start_frame
-                }
-                logger.info(f"   Frame {start_frame}: '{clip_name}'")
+                logger.warning("⚠️ Found %s items on V3, expected 14", len(timeline_items))
+
+            # Index every slot track once: entries sorted by start, with parallel
+            # starts/ends lists so each slot is located with a single bisect
+            track_index_map = {}
+            for slot_track in _SLOTS_BY_TRACK:
+                # Same snapshot the integrity check used: no second fetch or GetStart per item
+                items, item_starts = self._template_track(slot_track)
+                entries = []
+                logger.info("📊 Analyzing timeline clips on V%s:", slot_track)
+                for item, start_frame in zip(items, item_starts):
+                    # Slot items were already resolved by the integrity check; only extras cost RPCs
+                    media_pool_item, clip_name = self._template_item_media(item)
+                    entries.append({
+                        'item': item,
+                        'media_pool_item': media_pool_item,
+                        'clip_name': clip_name,
+                        'start_frame': start_frame,
+                        'end_frame': item.GetEnd()
+                    })
+                    logger.info("   Frame %s: '%s'", start_frame, clip_name)
+                entries.sort(key=lambda entry: entry['start_frame'])
+                track_index_map[slot_track] = (
+                    [entry['start_frame'] for entry in entries],
+                    [entry['end_frame'] for entry in entries],
+                    entries
+                )
+            # The replacements below edit these tracks, so the snapshot must not outlive this point
+            self._track_cache_timeline = None
 
             # Now map slot numbers to frame positions using CLIP_POSITIONS
             # This tells us: slot 1 should be at frame 86485, slot 2 at frame 86549, etc.
             slot_to_item = {}
-            logger.info(f"📊 Mapping slots to timeline positions:")
-            for slot_num, position in CLIP_POSITIONS.items():
-                expected_frame = position['start_frame']
-                if expected_frame in frame_to_item:
-                    slot_to_item[slot_num] = frame_to_item[expected_frame]
-                    clip_name = frame_to_item[expected_frame]['clip_name']
-                    logger.info(f"   Slot {slot_num} -> frame {expected_frame} (currently: '{clip_name}')")
-                else:
-                    logger.warning(f"   Slot {slot_num} -> frame {expected_frame} NOT FOUND")
+            logger.info("📊 Mapping slots to timeline positions:")
+            for slot_track, track_slots in _SLOTS_BY_TRACK.items():
+                starts, ends, entries = track_index_map[slot_track]
+                for expected_frame, slot_num in track_slots:
+                    i = bisect.bisect_right(starts, expected_frame) - 1
+                    if i >= 0 and expected_frame < ends[i]:
+                        slot_to_item[slot_num] = entries[i]
+                        clip_name = entries[i]['clip_name']
+                        logger.info("   Slot %s -> frame %s (currently: '%s')", slot_num, expected_frame, clip_name)
+                    else:
+                        logger.warning("   Slot %s -> frame %s NOT FOUND", slot_num, expected_frame)
 
             # Validate we mapped all 14 slots
             found_slots = sorted(slot_to_item.keys())
-            expected_slots = list(range(1, 15))
-            missing_slots = [s for s in expected_slots if s not in found_slots]
+            missing_slots = [s for s in CLIP_SLOTS if s not in slot_to_item]
 
             if missing_slots:
-                logger.error(f"❌ Missing slot mappings: {missing_slots}")
-                logger.error(f"   Found slots: {found_slots}")
-                logger.error(f"   Available frames: {sorted(frame_to_item.keys())}")
+                logger.error("❌ Missing slot mappings: %s", missing_slots)
+                logger.error("   Found slots: %s", found_slots)
+                logger.error("   Available frames: %s", [starts for starts, _, _ in track_index_map.values()])
                 return False
 
-            logger.info(f"✅ All 14 slots mapped to timeline positions")
+            logger.info("✅ All 14 slots mapped to timeline positions")
 
             # WARMUP PHASE: Look for warmup clips on V1 ONLY (below V2 and V3)
             # CRITICAL: V2 contains the main background video used throughout the entire timeline
@@ -715,26 +1170,26 @@ class DaVinciAutomation:
                     media = item.GetMediaPoolItem()
                     clip_name = media.GetName() if media else "Unknown (offline)"
                     warmup_items.append({'item': item, 'media': media, 'name': clip_name, 'track': 1})
-                    logger.info(f"🔥 Found warmup clip on V1: '{clip_name}'")
+                    logger.info("🔥 Found warmup clip on V1: '%s'", clip_name)
 
             if warmup_items:
-                logger.info(f"🔥 WARMUP PHASE: Priming AddTake API with {len(warmup_items)} warmup clip(s)")
+                logger.info("🔥 WARMUP PHASE: Priming AddTake API with %s warmup clip(s)", len(warmup_items))
 
                 # Get the first imported clip to use for warmup
                 first_imported = list(imported_clips.values())[0]['media_item'] if imported_clips else None
                 first_imported_path = list(imported_clips.values())[0]['path'] if imported_clips else None
-                logger.info(f"   Using imported clip for warmup: {first_imported.GetName() if first_imported else 'None'}")
+                logger.info("   Using imported clip for warmup: %s", first_imported.GetName() if first_imported else 'None')
 
                 warmup_succeeded = False
 
                 for warmup_info in warmup_items:
                     if warmup_succeeded:
-                        logger.info(f"   Skipping additional warmup clips (already primed)")
+                        logger.info("   Skipping additional warmup clips (already primed)")
                         break
 
                     warmup_item = warmup_info['item']
                     warmup_media = warmup_info['media']
-                    logger.info(f"   Processing warmup clip: '{warmup_info['name']}' on V{warmup_info['track']}")
+                    logger.info("   Processing warmup clip: '%s' on V%s", warmup_info['name'], warmup_info['track'])
 
                     if first_imported:
                         try:
@@ -747,55 +1202,55 @@ class DaVinciAutomation:
                             # we move to the next warmup clip or create a fresh one programmatically.
 
                             if warmup_media is None or warmup_info['name'] == "Unknown (offline)":
-                                logger.info(f"   ⚠️ Warmup clip media is offline, but trying AddTake anyway...")
+                                logger.info("   ⚠️ Warmup clip media is offline, but trying AddTake anyway...")
                             else:
                                 try:
                                     test_name = warmup_media.GetName()
-                                    logger.info(f"   Warmup media pool item is valid: '{test_name}'")
+                                    logger.info("   Warmup media pool item is valid: '%s'", test_name)
                                 except Exception as test_e:
-                                    logger.warning(f"   Warmup media pool item may be invalid: {test_e}")
+                                    logger.warning("   Warmup media pool item may be invalid: %s", test_e)
 
                             # IMPORTANT: Clear any existing takes from the warmup clip first
                             # This ensures AddTake can succeed (which is what primes the API)
-                            takes_before = warmup_item.GetTakesCount() if hasattr(warmup_item, 'GetTakesCount') else 0
-                            logger.info(f"   Warmup clip takes before: {takes_before}")
+                            takes_before = warmup_item.GetTakesCount() if _has(warmup_item, 'TimelineItem', 'GetTakesCount') else 0
+                            logger.info("   Warmup clip takes before: %s", takes_before)
 
                             if takes_before > 0:
-                                logger.info(f"   Clearing {takes_before} existing take(s) from warmup clip...")
+                                logger.info("   Clearing %s existing take(s) from warmup clip...", takes_before)
                                 for i in range(takes_before, 0, -1):
                                     try:
                                         del_result = warmup_item.DeleteTakeByIndex(i)
-                                        logger.info(f"   Deleted take {i}: {del_result}")
+                                        logger.info("   Deleted take %s: %s", i, del_result)
                                     except Exception as del_e:
-                                        logger.warning(f"   Could not delete take {i}: {del_e}")
+                                        logger.warning("   Could not delete take %s: %s", i, del_e)
 
-                                takes_after_clear = warmup_item.GetTakesCount() if hasattr(warmup_item, 'GetTakesCount') else 0
-                                logger.info(f"   Takes after clearing: {takes_after_clear}")
+                                takes_after_clear = warmup_item.GetTakesCount() if _has(warmup_item, 'TimelineItem', 'GetTakesCount') else 0
+                                logger.info("   Takes after clearing: %s", takes_after_clear)
 
                             # Now try AddTake - should succeed and prime the API
                             warmup_result = warmup_item.AddTake(first_imported, 0, 100)
 
                             # Check takes after
-                            takes_after = warmup_item.GetTakesCount() if hasattr(warmup_item, 'GetTakesCount') else 0
-                            logger.info(f"   Warmup AddTake result: {warmup_result}, takes after: {takes_after}")
+                            takes_after = warmup_item.GetTakesCount() if _has(warmup_item, 'TimelineItem', 'GetTakesCount') else 0
+                            logger.info("   Warmup AddTake result: %s, takes after: %s", warmup_result, takes_after)
 
                             if warmup_result:
-                                logger.info(f"   ✅ Warmup succeeded - API should be primed!")
+                                logger.info("   ✅ Warmup succeeded - API should be primed!")
                                 warmup_succeeded = True
                             else:
-                                logger.warning(f"   ⚠️ Warmup AddTake returned False - trying next warmup clip")
+                                logger.warning("   ⚠️ Warmup AddTake returned False - trying next warmup clip")
                         except Exception as warmup_e:
-                            logger.warning(f"   Warmup exception: {warmup_e}")
+                            logger.warning("   Warmup exception: %s", warmup_e)
                     else:
-                        logger.warning(f"   No imported clip available for warmup!")
+                        logger.warning("   No imported clip available for warmup!")
 
                 if not warmup_succeeded:
-                    logger.warning(f"   ⚠️ All warmup attempts failed - trying to create fresh warmup clip")
+                    logger.warning("   ⚠️ All warmup attempts failed - trying to create fresh warmup clip")
                     # FALLBACK: Create a fresh warmup clip programmatically
                     # This handles the case where existing warmup clips are completely broken
                     try:
                         if first_imported:
-                            logger.info(f"   Creating fresh warmup clip on V1...")
+                            logger.info("   Creating fresh warmup clip on V1...")
                             # Add the first imported clip to V1 at frame 0
                             warmup_clip_info = {
                                 "mediaPoolItem": first_imported,
@@ -808,7 +1263,7 @@ class DaVinciAutomation:
                             fresh_warmup = self.media_pool.AppendToTimeline([warmup_clip_info])
                             if fresh_warmup and len(fresh_warmup) > 0:
                                 fresh_warmup_item = fresh_warmup[0]
-                                logger.info(f"   Fresh warmup clip created, attempting AddTake...")
+                                logger.info("   Fresh warmup clip created, attempting AddTake...")
                                 # Use the second imported clip (if available) for AddTake
                                 second_imported = None
                                 if len(imported_clips) > 1:
@@ -817,24 +1272,24 @@ class DaVinciAutomation:
                                     second_imported = first_imported  # Use same clip if only one
 
                                 fresh_warmup_result = fresh_warmup_item.AddTake(second_imported, 0, 50)
-                                logger.info(f"   Fresh warmup AddTake result: {fresh_warmup_result}")
+                                logger.info("   Fresh warmup AddTake result: %s", fresh_warmup_result)
                                 if fresh_warmup_result:
-                                    logger.info(f"   ✅ Fresh warmup succeeded - API should be primed!")
+                                    logger.info("   ✅ Fresh warmup succeeded - API should be primed!")
                                     warmup_succeeded = True
                             else:
-                                logger.warning(f"   Could not create fresh warmup clip")
+                                logger.warning("   Could not create fresh warmup clip")
                     except Exception as fresh_e:
-                        logger.warning(f"   Fresh warmup creation failed: {fresh_e}")
+                        logger.warning("   Fresh warmup creation failed: %s", fresh_e)
 
                 if not warmup_succeeded:
-                    logger.warning(f"   ⚠️ All warmup methods failed - first real slot may fail AddTake")
+                    logger.warning("   ⚠️ All warmup methods failed - first real slot may fail AddTake")
             else:
-                logger.info(f"ℹ️ No warmup clips found on V1 - creating fresh warmup clip")
+                logger.info("ℹ️ No warmup clips found on V1 - creating fresh warmup clip")
                 # No existing warmup clips - create one fresh
                 first_imported = list(imported_clips.values())[0]['media_item'] if imported_clips else None
                 if first_imported:
                     try:
-                        logger.info(f"   Creating fresh warmup clip on V1...")
+                        logger.info("   Creating fresh warmup clip on V1...")
                         warmup_clip_info = {
                             "mediaPoolItem": first_imported,
                             "startFrame": 0,
@@ -854,35 +1309,33 @@ class DaVinciAutomation:
                                 second_imported = first_imported
 
                             fresh_warmup_result = fresh_warmup_item.AddTake(second_imported, 0, 50)
-                            logger.info(f"   Fresh warmup AddTake result: {fresh_warmup_result}")
+                            logger.info("   Fresh warmup AddTake result: %s", fresh_warmup_result)
                             if fresh_warmup_result:
-                                logger.info(f"   ✅ Fresh warmup succeeded - API should be primed!")
+                                logger.info("   ✅ Fresh warmup succeeded - API should be primed!")
                     except Exception as fresh_e:
-                        logger.warning(f"   Fresh warmup creation failed: {fresh_e}")
+                        logger.warning("   Fresh warmup creation failed: %s", fresh_e)
 
             # STEP 3: Replace each clip by matching slot numbers
             # CRITICAL: We use AddTake/SelectTake/FinalizeTake which replaces per-timeline-instance
             # DO NOT use MediaPoolItem.ReplaceClip as it modifies the source file reference globally
             replaced_slots = []
             processed_slots = set()
-            replacement_methods = {}  # Track which method worked for each slot
 
-            for slot_number in sorted(imported_clips.keys()):
-                clip_data = imported_clips[slot_number]
-                logger.info(f"🎬 Processing slot {slot_number}")
+            for slot_number, clip_data in sorted(imported_clips.items()):
+                logger.debug("🎬 Processing slot %s", slot_number)
 
                 # Check if we've already processed this slot (prevent duplicates)
                 if slot_number in processed_slots:
-                    logger.error(f"❌ Slot {slot_number} already processed! Skipping duplicate")
+                    logger.error("❌ Slot %s already processed! Skipping duplicate", slot_number)
                     continue
 
-                # Find the timeline item for this slot number
-                if slot_number not in slot_to_item:
-                    logger.error(f"❌ No timeline item found for slot {slot_number}")
-                    logger.error(f"   Available slots: {sorted(slot_to_item.keys())}")
+                # Find the timeline item for this slot number (one lookup serves test and fetch)
+                slot_info = slot_to_item.get(slot_number)
+                if slot_info is None:
+                    logger.error("❌ No timeline item found for slot %s", slot_number)
+                    logger.error("   Available slots: %s", sorted(slot_to_item.keys()))
                     continue
 
-                slot_info = slot_to_item[slot_number]
                 target_item = slot_info['item']
 
                 # Mark this slot as processed
@@ -891,373 +1344,401 @@ class DaVinciAutomation:
                 new_media_item = clip_data['media_item']
                 new_clip_path = clip_data['path']
                 new_filename = clip_data['clip_info']['filename']
-                replaced = False
 
                 # Get current media info from our pre-scanned data
                 current_name = slot_info['clip_name']
                 current_frame = slot_info['start_frame']
-                logger.info(f"   Current clip: {current_name} (frame {current_frame})")
-                logger.info(f"   New clip: {new_filename}")
+                logger.debug("   Current clip: %s (frame %s)", current_name, current_frame)
+                logger.debug("   New clip: %s", new_filename)
 
                 # DEBUG: Log detailed info about the new media item
-                logger.info(f"   === DEBUG: new_media_item details ===")
-                logger.info(f"   Type: {type(new_media_item)}")
-                logger.info(f"   Value: {new_media_item}")
-                if new_media_item:
+                # (these dumps cost several Resolve calls per slot, so only when debug logging is on)
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug("   === DEBUG: new_media_item details ===")
+                    logger.debug("   Type: %s", type(new_media_item))
+                    logger.debug("   Value: %s", new_media_item)
+                if not new_media_item:
+                    logger.error("   ❌ new_media_item is None or invalid!")
+                elif debug_enabled:
                     try:
-                        if hasattr(new_media_item, 'GetName'):
-                            logger.info(f"   GetName(): {new_media_item.GetName()}")
-                        if hasattr(new_media_item, 'GetClipProperty'):
+                        if _has(new_media_item, 'MediaPoolItem', 'GetName'):
+                            logger.debug("   GetName(): %s", new_media_item.GetName())
+                        if _has(new_media_item, 'MediaPoolItem', 'GetClipProperty'):
                             props = new_media_item.GetClipProperty()
-                            logger.info(f"   GetClipProperty(): {props}")
+                            logger.debug("   GetClipProperty(): %s", props)
                         # List all available methods
                         media_methods = [m for m in dir(new_media_item) if not m.startswith('_')]
-                        logger.info(f"   Available methods: {media_methods[:20]}...")  # First 20
+                        logger.debug("   Available methods: %s...", media_methods[:20])  # First 20
                     except Exception as debug_e:
-                        logger.warning(f"   Debug error: {debug_e}")
-                else:
-                    logger.error(f"   ❌ new_media_item is None or invalid!")
+                        logger.warning("   Debug error: %s", debug_e)
 
                 # DEBUG: Log detailed info about the target timeline item
-                logger.info(f"   === DEBUG: target_item details ===")
-                logger.info(f"   Type: {type(target_item)}")
-                if hasattr(target_item, 'GetName'):
-                    try:
-                        logger.info(f"   GetName(): {target_item.GetName()}")
-                    except:
-                        pass
+                if debug_enabled:
+                    logger.debug("   === DEBUG: target_item details ===")
+                    logger.debug("   Type: %s", type(target_item))
+                    if _has(target_item, 'TimelineItem', 'GetName'):
+                        try:
+                            logger.debug("   GetName(): %s", target_item.GetName())
+                        except:
+                            pass
 
                 # Check for retiming (which prevents AddTake from working)
                 has_retiming = False
                 try:
-                    if hasattr(target_item, 'GetProperty'):
+                    if _has(target_item, 'TimelineItem', 'GetProperty'):
                         # Check various retime-related properties
                         retime_props = ['Speed', 'SpeedZoneCount', 'ReTimeProcess']
                         for prop in retime_props:
                             val = target_item.GetProperty(prop)
                             if val is not None:
-                                logger.info(f"   {prop}: {val}")
+                                logger.debug("   %s: %s", prop, val)
                                 if prop == 'Speed' and val != 100 and val != 1.0:
                                     has_retiming = True
-                                    logger.warning(f"   ⚠️ Clip has retiming (Speed={val}) - AddTake may fail!")
+                                    logger.warning("   ⚠️ Clip has retiming (Speed=%s) - AddTake may fail!", val)
                 except Exception as prop_e:
-                    logger.debug(f"   Could not check retime properties: {prop_e}")
+                    logger.debug("   Could not check retime properties: %s", prop_e)
+
+                # Try each replacement strategy in order until one succeeds
+                for replace_method in self._replacement_chain:
+                    method_name = replace_method(slot_number, slot_info, new_media_item, new_clip_path)
+                    if method_name:
+                        replaced_slots.append(slot_number)
+                        # One INFO line per slot; the per-step detail above is DEBUG only
+                        logger.info("✅ Slot %s: %s -> %s (%s)", slot_number, current_name, new_filename, method_name)
+                        break
+                else:
+                    logger.error("❌ Failed to replace slot %s - ALL methods failed", slot_number)
+                    logger.error("   The template may need unique media pool items per position")
 
-                # METHOD 1: Use AddTake + SelectTake (preferred - per-instance replacement)
-                try:
-                    logger.info(f"   Attempting AddTake method...")
-
-                    # Log available methods on the timeline item for debugging
-                    take_methods = [m for m in dir(target_item) if 'take' in m.lower() or 'Take' in m]
-                    logger.info(f"   Available take methods: {take_methods}")
-
-                    # CRITICAL: Clear any existing takes from previous renders
-                    # This is necessary because DaVinci retains takes even after close without save
-                    if hasattr(target_item, 'GetTakesCount') and hasattr(target_item, 'DeleteTakeByIndex'):
-                        existing_takes = target_item.GetTakesCount()
-                        if existing_takes > 0:
-                            logger.info(f"   Clearing {existing_takes} existing take(s)...")
-                            # Delete takes from highest index to lowest to avoid index shifting
-                            for i in range(existing_takes, 0, -1):
-                                try:
-                                    del_result = target_item.DeleteTakeByIndex(i)
-                                    logger.info(f"   Deleted take {i}: {del_result}")
-                                except Exception as de:
-                                    logger.warning(f"   Could not delete take {i}: {de}")
-
-                    # Check current takes count
-                    takes_count_before = 0
-                    if hasattr(target_item, 'GetTakesCount'):
-                        takes_count_before = target_item.GetTakesCount()
-                        logger.info(f"   Takes before: {takes_count_before}")
-
-                    # Add the new clip as a take
-                    # API signature: AddTake(mediaPoolItem, startFrame, endFrame)
-                    # Note: Retimed clips cannot use the take system!
-                    add_result = None
-
-                    # Get the new clip's frame range
-                    new_clip_props = new_media_item.GetClipProperty() if new_media_item else {}
-                    new_start_frame = int(new_clip_props.get('Start', 0))
-                    new_end_frame = int(new_clip_props.get('End', new_clip_props.get('Frames', 100)))
-                    logger.info(f"   New clip frame range: {new_start_frame} - {new_end_frame}")
-
-                    # Check if target clip has retiming (which prevents AddTake from working)
-                    # Unfortunately there's no direct API to check this
-
-                    # Try 1: AddTake with full signature (mediaPoolItem, startFrame, endFrame)
-                    logger.info(f"   Trying AddTake(mediaPoolItem, startFrame, endFrame)...")
-                    try:
-                        add_result = target_item.AddTake(new_media_item, new_start_frame, new_end_frame)
-                        logger.info(f"   AddTake(full signature) result: {add_result} (type: {type(add_result)})")
-                    except Exception as e1:
-                        logger.warning(f"   AddTake(full signature) exception: {e1}")
-
-                    # Try 2: AddTake with just MediaPoolItem (some versions)
-                    if not add_result:
-                        logger.info(f"   Trying AddTake(MediaPoolItem only)...")
-                        try:
-                            add_result = target_item.AddTake(new_media_item)
-                            logger.info(f"   AddTake(MediaPoolItem) result: {add_result}")
-                        except Exception as e2:
-                            logger.warning(f"   AddTake(MediaPoolItem) exception: {e2}")
-
-                    # Try 3: AddTake with 0, -1 for full clip range
-                    if not add_result:
-                        logger.info(f"   Trying AddTake with 0, -1 range...")
-                        try:
-                            add_result = target_item.AddTake(new_media_item, 0, -1)
-                            logger.info(f"   AddTake(0, -1) result: {add_result}")
-                        except Exception as e3:
-                            logger.warning(f"   AddTake(0, -1) exception: {e3}")
-
-                    logger.info(f"   Final AddTake result: {add_result}")
-
-                    # Check takes count after
-                    takes_count_after = 0
-                    if hasattr(target_item, 'GetTakesCount'):
-                        takes_count_after = target_item.GetTakesCount()
-                        logger.info(f"   Takes after: {takes_count_after}")
-
-                    # If takes increased, the add worked
-                    if takes_count_after > takes_count_before:
-                        logger.info(f"   AddTake succeeded, {takes_count_after} takes now")
-
-                        # Select the latest take (the one we just added)
-                        if hasattr(target_item, 'SelectTakeByIndex'):
-                            select_result = target_item.SelectTakeByIndex(takes_count_after)
-                            logger.info(f"   SelectTakeByIndex({takes_count_after}) result: {select_result}")
-
-                            if select_result:
-                                # NOTE: Do NOT call FinalizeTake() here!
-                                # FinalizeTake() permanently removes all other takes and prevents
-                                # future AddTake calls from working. We just select the take
-                                # and render - the selection is enough for the render to use it.
-
-                                # Verify the replacement worked
-                                verify_media = target_item.GetMediaPoolItem()
-                                verify_name = verify_media.GetName() if verify_media else "Unknown"
-                                logger.info(f"   Verification: clip is now '{verify_name}'")
-
-                                replaced_slots.append(slot_number)
-                                replaced = True
-                                replacement_methods[slot_number] = "AddTake"
-                                logger.info(f"✅ Slot {slot_number}: AddTake method succeeded (take selected)")
-                    elif add_result:
-                        # AddTake returned truthy but count didn't change - still try to proceed
-                        logger.warning(f"   AddTake returned {add_result} but takes count unchanged")
-                        # Try selecting anyway (no finalize)
-                        if hasattr(target_item, 'GetTakesCount'):
-                            take_count = target_item.GetTakesCount()
-                            if take_count > 0 and hasattr(target_item, 'SelectTakeByIndex'):
-                                target_item.SelectTakeByIndex(take_count)
-                                replaced_slots.append(slot_number)
-                                replaced = True
-                                replacement_methods[slot_number] = "AddTake-forced"
-                                logger.info(f"✅ Slot {slot_number}: AddTake method (forced, take selected)")
+            # POST-REPLACEMENT VALIDATION
+            logger.info("🎉 Clip replacement complete: %s/%s slots replaced", len(replaced_slots), len(imported_clips))
+            logger.info("   Replaced slots: %s", sorted(replaced_slots))
+
+            if len(replaced_slots) < len(imported_clips):
+                missing_slots = set(imported_clips.keys()) - set(replaced_slots)
+                logger.error("❌ CRITICAL: Failed to replace %s slot(s): %s", len(missing_slots), sorted(missing_slots))
+                logger.error("   ABORTING: Will not save or render incomplete timeline")
+                return False
+
+            logger.info("✅ SUCCESS: All %s slots were successfully replaced", len(replaced_slots))
+            return True
 
+        except Exception as e:
+            logger.error("Failed to replace clips from project: %s", e)
+            logger.error(traceback.format_exc())
+            return False
+    
+    def _replace_via_add_take(self, slot_number, slot_info, new_media_item, new_clip_path):
+        """METHOD 1: AddTake + SelectTake (preferred - per-instance replacement)"""
+        target_item = slot_info['item']
+        try:
+            logger.debug("   Attempting AddTake method...")
+
+            # Log available methods on the timeline item for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                take_methods = [m for m in dir(target_item) if 'take' in m.lower() or 'Take' in m]
+                logger.debug("   Available take methods: %s", take_methods)
+
+            # CRITICAL: Clear any existing takes from previous renders
+            # This is necessary because DaVinci retains takes even after close without save
+            if _has(target_item, 'TimelineItem', 'GetTakesCount') and _has(target_item, 'TimelineItem', 'DeleteTakeByIndex'):
+                existing_takes = target_item.GetTakesCount()
+                if existing_takes > 0:
+                    logger.debug("   Clearing %s existing take(s)...", existing_takes)
+                    # Delete takes from highest index to lowest to avoid index shifting
+                    for i in range(existing_takes, 0, -1):
+                        try:
+                            del_result = target_item.DeleteTakeByIndex(i)
+                            logger.debug("   Deleted take %s: %s", i, del_result)
+                        except Exception as de:
+                            logger.warning("   Could not delete take %s: %s", i, de)
+
+            # Check current takes count
+            takes_count_before = 0
+            if _has(target_item, 'TimelineItem', 'GetTakesCount'):
+                takes_count_before = target_item.GetTakesCount()
+                logger.debug("   Takes before: %s", takes_count_before)
+
+            # Add the new clip as a take
+            # API signature: AddTake(mediaPoolItem, startFrame, endFrame)
+            # Note: Retimed clips cannot use the take system!
+            add_result = None
+
+            # Get the new clip's frame range
+            new_clip_props = new_media_item.GetClipProperty() if new_media_item else {}
+            new_start_frame = int(new_clip_props.get('Start', 0))
+            new_end_frame = int(new_clip_props.get('End', new_clip_props.get('Frames', 100)))
+            logger.debug("   New clip frame range: %s - %s", new_start_frame, new_end_frame)
+
+            # Check if target clip has retiming (which prevents AddTake from working)
+            # Unfortunately there's no direct API to check this
+
+            # AddTake signatures differ between Resolve versions: full (mediaPoolItem, startFrame,
+            # endFrame), MediaPoolItem only, or 0, -1 for the full clip range.
+            # Start with the one that last worked so later slots normally need a single call
+            signatures = (
+                ("full signature", (new_media_item, new_start_frame, new_end_frame)),
+                ("MediaPoolItem only", (new_media_item,)),
+                ("0, -1 range", (new_media_item, 0, -1)),
+            )
+            order = sorted(range(len(signatures)), key=lambda i: i != self._add_take_signature)
+            for i in order:
+                label, args = signatures[i]
+                logger.debug("   Trying AddTake(%s)...", label)
+                try:
+                    add_result = target_item.AddTake(*args)
+                    logger.debug("   AddTake(%s) result: %s", label, add_result)
                 except Exception as e:
-                    logger.warning(f"   AddTake method exception: {e}")
-                    import traceback
-                    logger.warning(traceback.format_exc())
+                    logger.warning("   AddTake(%s) exception: %s", label, e)
+                if add_result:
+                    self._add_take_signature = i
+                    break
 
-                # METHOD 2: Direct ReplaceClip on timeline item (if available)
-                # This is safe as it only affects this timeline instance
-                if not replaced:
-                    try:
-                        logger.info(f"   Attempting TimelineItem.ReplaceClip...")
-                        replace_clip_method = getattr(target_item, 'ReplaceClip', None)
-                        logger.info(f"   ReplaceClip method: {replace_clip_method}")
-
-                        if replace_clip_method and callable(replace_clip_method):
-                            result = replace_clip_method(new_media_item)
-                            logger.info(f"   ReplaceClip result: {result}")
-                            if result:
-                                replaced_slots.append(slot_number)
-                                replaced = True
-                                replacement_methods[slot_number] = "TimelineItem.ReplaceClip"
-                                logger.info(f"✅ Slot {slot_number}: TimelineItem.ReplaceClip succeeded")
-                        else:
-                            logger.warning(f"   ReplaceClip not available or not callable")
-                    except Exception as e:
-                        logger.warning(f"   TimelineItem.ReplaceClip failed: {e}")
+            logger.debug("   Final AddTake result: %s", add_result)
+
+            # Check takes count after
+            takes_count_after = 0
+            if _has(target_item, 'TimelineItem', 'GetTakesCount'):
+                takes_count_after = target_item.GetTakesCount()
+                logger.debug("   Takes after: %s", takes_count_after)
+
+            # If takes increased, the add worked
+            if takes_count_after > takes_count_before:
+                logger.debug("   AddTake succeeded, %s takes now", takes_count_after)
+
+                # Select the latest take (the one we just added)
+                if _has(target_item, 'TimelineItem', 'SelectTakeByIndex'):
+                    select_result = target_item.SelectTakeByIndex(takes_count_after)
+                    logger.debug("   SelectTakeByIndex(%s) result: %s", takes_count_after, select_result)
+
+                    if select_result:
+                        # NOTE: Do NOT call FinalizeTake() here!
+                        # FinalizeTake() permanently removes all other takes and prevents
+                        # future AddTake calls from working. We just select the take
+                        # and render - the selection is enough for the render to use it.
+
+                        # Verify the replacement worked (two Resolve calls, so only when debug logging is on)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            verify_media = target_item.GetMediaPoolItem()
+                            verify_name = verify_media.GetName() if verify_media else "Unknown"
+                            logger.debug("   Verification: clip is now '%s'", verify_name)
+
+                        logger.debug("✅ Slot %s: AddTake method succeeded (take selected)", slot_number)
+                        return "AddTake"
+            elif add_result:
+                # AddTake returned truthy but count didn't change - still try to proceed
+                logger.warning("   AddTake returned %s but takes count unchanged", add_result)
+                # Try selecting anyway (no finalize)
+                if _has(target_item, 'TimelineItem', 'GetTakesCount'):
+                    take_count = target_item.GetTakesCount()
+                    if take_count > 0 and _has(target_item, 'TimelineItem', 'SelectTakeByIndex'):
+                        target_item.SelectTakeByIndex(take_count)
+                        logger.debug("✅ Slot %s: AddTake method (forced, take selected)", slot_number)
+                        return "AddTake-forced"
 
-                # METHOD 3: Delete and Re-add (safest - doesn't modify media pool items)
-                # This deletes the existing timeline item and adds the new clip at the same position
-                # We preserve transform/composite properties and reapply them to the new clip
-                if not replaced:
+        except Exception as e:
+            logger.warning("   AddTake method exception: %s", e)
+            logger.warning(traceback.format_exc())
+        return None
+    
+    def _replace_via_timeline_replace_clip(self, slot_number, slot_info, new_media_item, new_clip_path):
+        """METHOD 2: Direct ReplaceClip on timeline item (safe - only affects this timeline instance)"""
+        target_item = slot_info['item']
+        try:
+            logger.debug("   Attempting TimelineItem.ReplaceClip...")
+
+            if _has(target_item, 'TimelineItem', 'ReplaceClip'):
+                result = target_item.ReplaceClip(new_media_item)
+                logger.debug("   ReplaceClip result: %s", result)
+                if result:
+                    logger.debug("✅ Slot %s: TimelineItem.ReplaceClip succeeded", slot_number)
+                    return "TimelineItem.ReplaceClip"
+            else:
+                logger.warning("   ReplaceClip not available or not callable")
+        except Exception as e:
+            logger.warning("   TimelineItem.ReplaceClip failed: %s", e)
+        return None
+    
+    def _replace_via_delete_and_add(self, slot_number, slot_info, new_media_item, new_clip_path):
+        """METHOD 3: Delete and Re-add (safest - doesn't modify media pool items)
+
+        Deletes the existing timeline item and adds the new clip at the same position,
+        preserving transform/composite properties and reapplying them to the new clip
+        """
+        target_item = slot_info['item']
+        try:
+            logger.debug("   Attempting Delete-and-Add method...")
+
+            # Get the existing clip's timeline position info (start/end already indexed, so the
+            # duration needs no GetDuration round trip)
+            existing_start = slot_info['start_frame']
+            existing_end = slot_info['end_frame']
+            existing_duration = existing_end - existing_start
+            track_index = 3  # V3 track
+
+            logger.debug("   Existing clip: start=%s, duration=%s, end=%s", existing_start, existing_duration, existing_end)
+
+            # PRESERVE CLIP PROPERTIES before deleting
+            # These are the transform, composite, and other properties we want to keep
+            preserved_properties = {}
+            property_keys = [
+                # Transform properties
+                'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'ZoomGang', 'RotationAngle',
+                'AnchorPointX', 'AnchorPointY', 'Pitch', 'Yaw',
+                'FlipX', 'FlipY',
+                # Crop properties
+                'CropLeft', 'CropRight', 'CropTop', 'CropBottom', 'CropRetain',
+                # Composite properties
+                'Opacity', 'CompositeMode',
+                # Dynamic Zoom
+                'DynamicZoomEase',
+                # Distortion/Lens
+                'DistortionAmount', 'LensCorrection',
+                # Stabilization
+                'StabilizationMode',
+                # Scaling
+                'ResizeFilter', 'ScalingPreset',
+            ]
+
+            logger.debug("   Preserving clip properties...")
+            # GetProperty() with no key returns every property in one call
+            try:
+                all_properties = target_item.GetProperty()
+            except Exception:
+                all_properties = None
+            if isinstance(all_properties, dict):
+                preserved_properties = {prop_key: all_properties[prop_key] for prop_key in property_keys
+                                        if all_properties.get(prop_key) is not None}
+            else:
+                for prop_key in property_keys:
                     try:
-                        logger.info(f"   Attempting Delete-and-Add method...")
-
-                        # Get the existing clip's timeline position info
-                        existing_start = target_item.GetStart()
-                        existing_duration = target_item.GetDuration()
-                        existing_end = target_item.GetEnd()
-                        track_index = 3  # V3 track
-
-                        logger.info(f"   Existing clip: start={existing_start}, duration={existing_duration}, end={existing_end}")
-
-                        # PRESERVE CLIP PROPERTIES before deleting
-                        # These are the transform, composite, and other properties we want to keep
-                        preserved_properties = {}
-                        property_keys = [
-                            # Transform properties
-                            'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'ZoomGang', 'RotationAngle',
-                            'AnchorPointX', 'AnchorPointY', 'Pitch', 'Yaw',
-                            'FlipX', 'FlipY',
-                            # Crop properties
-                            'CropLeft', 'CropRight', 'CropTop', 'CropBottom', 'CropRetain',
-                            # Composite properties
-                            'Opacity', 'CompositeMode',
-                            # Dynamic Zoom
-                            'DynamicZoomEase',
-                            # Distortion/Lens
-                            'DistortionAmount', 'LensCorrection',
-                            # Stabilization
-                            'StabilizationMode',
-                            # Scaling
-                            'ResizeFilter', 'ScalingPreset',
-                        ]
-
-                        logger.info(f"   Preserving clip properties...")
-                        for prop_key in property_keys:
-                            try:
-                                prop_value = target_item.GetProperty(prop_key)
-                                if prop_value is not None:
-                                    preserved_properties[prop_key] = prop_value
-                            except:
-                                pass  # Property might not exist or be readable
-
-                        if preserved_properties:
-                            logger.info(f"   Preserved {len(preserved_properties)} properties: {list(preserved_properties.keys())}")
-                        else:
-                            logger.info(f"   No properties to preserve (using defaults)")
-
-                        # Get the new clip's source frame range
-                        new_clip_props = new_media_item.GetClipProperty() if new_media_item else {}
-                        source_start = int(new_clip_props.get('Start', '0'))
-                        # Handle string values from DaVinci - 'End' and 'Frames' are returned as strings
-                        end_val = new_clip_props.get('End')
-                        if end_val:
-                            source_end = int(end_val)
-                        else:
-                            frames_val = new_clip_props.get('Frames', '100')
-                            source_end = int(frames_val) - 1
-                        logger.info(f"   New clip source range: {source_start} - {source_end}")
+                        prop_value = target_item.GetProperty(prop_key)
+                        if prop_value is not None:
+                            preserved_properties[prop_key] = prop_value
+                    except:
+                        pass  # Property might not exist or be readable
 
-                        # Delete the existing timeline item
-                        logger.info(f"   Deleting existing timeline item...")
-                        delete_result = self.timeline.DeleteClips([target_item], False)
-                        logger.info(f"   DeleteClips result: {delete_result}")
+            if preserved_properties:
+                logger.debug("   Preserved %s properties: %s", len(preserved_properties), list(preserved_properties.keys()))
+            else:
+                logger.debug("   No properties to preserve (using defaults)")
+
+            # Get the new clip's source frame range
+            new_clip_props = new_media_item.GetClipProperty() if new_media_item else {}
+            source_start = int(new_clip_props.get('Start', '0'))
+            # Handle string values from DaVinci - 'End' and 'Frames' are returned as strings
+            end_val = new_clip_props.get('End')
+            if end_val:
+                source_end = int(end_val)
+            else:
+                frames_val = new_clip_props.get('Frames', '100')
+                source_end = int(frames_val) - 1
+            logger.debug("   New clip source range: %s - %s", source_start, source_end)
+
+            # Delete the existing timeline item
+            logger.debug("   Deleting existing timeline item...")
+            delete_result = self.timeline.DeleteClips([target_item], False)
+            logger.debug("   DeleteClips result: %s", delete_result)
+
+            if delete_result:
+                # Add the new clip at the same timeline position
+                clip_info = {
+                    "mediaPoolItem": new_media_item,
+                    "startFrame": source_start,
+                    "endFrame": source_end,
+                    "mediaType": 1,  # Video only
+                    "trackIndex": track_index,
+                    "recordFrame": existing_start  # Timeline position
+                }
+                logger.debug("   Adding new clip with clipInfo: recordFrame=%s, trackIndex=%s", existing_start, track_index)
 
-                        if delete_result:
-                            # Add the new clip at the same timeline position
-                            clip_info = {
-                                "mediaPoolItem": new_media_item,
-                                "startFrame": source_start,
-                                "endFrame": source_end,
-                                "mediaType": 1,  # Video only
-                                "trackIndex": track_index,
-                                "recordFrame": existing_start  # Timeline position
-                            }
-                            logger.info(f"   Adding new clip with clipInfo: recordFrame={existing_start}, trackIndex={track_index}")
-
-                            append_result = self.media_pool.AppendToTimeline([clip_info])
-                            logger.info(f"   AppendToTimeline result: {append_result}")
-
-                            if append_result and len(append_result) > 0:
-                                new_timeline_item = append_result[0]
-
-                                # RESTORE PRESERVED PROPERTIES to the new clip
-                                if preserved_properties and new_timeline_item:
-                                    logger.info(f"   Restoring {len(preserved_properties)} properties to new clip...")
-                                    restore_count = 0
-                                    for prop_key, prop_value in preserved_properties.items():
-                                        try:
-                                            set_result = new_timeline_item.SetProperty(prop_key, prop_value)
-                                            if set_result:
-                                                restore_count += 1
-                                        except Exception as prop_err:
-                                            logger.debug(f"   Could not restore {prop_key}: {prop_err}")
-                                    logger.info(f"   Restored {restore_count}/{len(preserved_properties)} properties")
-
-                                replaced_slots.append(slot_number)
-                                replaced = True
-                                replacement_methods[slot_number] = "Delete-and-Add"
-                                logger.info(f"✅ Slot {slot_number}: Delete-and-Add succeeded (with property preservation)")
-                            else:
-                                logger.warning(f"   AppendToTimeline returned empty/None")
-                                # Try without recordFrame as fallback
-                                logger.info(f"   Trying AppendToTimeline without recordFrame...")
-                                simple_result = self.media_pool.AppendToTimeline([new_media_item])
-                                if simple_result:
-                                    logger.warning(f"   ⚠️ Clip added but may be at wrong position!")
-                        else:
-                            logger.warning(f"   DeleteClips failed")
+                append_result = self.media_pool.AppendToTimeline([clip_info])
+                logger.debug("   AppendToTimeline result: %s", append_result)
 
-                    except Exception as e:
-                        logger.warning(f"   Delete-and-Add method failed: {e}")
-                        import traceback
-                        logger.warning(traceback.format_exc())
-
-                # METHOD 4: MediaPoolItem.ReplaceClip (LAST RESORT - corrupts template!)
-                # WARNING: This modifies the source file reference globally
-                # Only use this if all other methods fail
-                if not replaced:
-                    try:
-                        logger.warning(f"   ⚠️ Falling back to MediaPoolItem.ReplaceClip (may corrupt template)...")
-
-                        original_media = slot_info.get('media_pool_item')
-                        if original_media and hasattr(original_media, 'ReplaceClip'):
-                            original_name = original_media.GetName() if hasattr(original_media, 'GetName') else "unknown"
-                            logger.info(f"   Original media pool item: '{original_name}'")
-                            logger.info(f"   Replacing with: {new_clip_path}")
-
-                            replace_result = original_media.ReplaceClip(new_clip_path)
-                            logger.info(f"   MediaPoolItem.ReplaceClip result: {replace_result}")
-
-                            if replace_result:
-                                replaced_slots.append(slot_number)
-                                replaced = True
-                                replacement_methods[slot_number] = "MediaPoolItem.ReplaceClip"
-                                logger.warning(f"✅ Slot {slot_number}: MediaPoolItem.ReplaceClip succeeded (template may be corrupted)")
-                        else:
-                            logger.warning(f"   MediaPoolItem.ReplaceClip not available")
-                    except Exception as e:
-                        logger.warning(f"   MediaPoolItem.ReplaceClip failed: {e}")
+                if append_result and len(append_result) > 0:
+                    new_timeline_item = append_result[0]
 
-                if not replaced:
-                    logger.error(f"❌ Failed to replace slot {slot_number} - ALL methods failed")
-                    logger.error(f"   The template may need unique media pool items per position")
+                    # RESTORE PRESERVED PROPERTIES to the new clip
+                    if preserved_properties and new_timeline_item:
+                        logger.debug("   Restoring %s properties to new clip...", len(preserved_properties))
+                        restore_count = 0
+                        for prop_key, prop_value in preserved_properties.items():
+                            try:
+                                set_result = new_timeline_item.SetProperty(prop_key, prop_value)
+                                if set_result:
+                                    restore_count += 1
+                            except Exception as prop_err:
+                                logger.debug("   Could not restore %s: %s", prop_key, prop_err)
+                        logger.debug("   Restored %s/%s properties", restore_count, len(preserved_properties))
+
+                    logger.debug("✅ Slot %s: Delete-and-Add succeeded (with property preservation)", slot_number)
+                    return "Delete-and-Add"
+                else:
+                    logger.warning("   AppendToTimeline returned empty/None")
+                    # Try without recordFrame as fallback
+                    logger.debug("   Trying AppendToTimeline without recordFrame...")
+                    simple_result = self.media_pool.AppendToTimeline([new_media_item])
+                    if simple_result:
+                        logger.warning("   ⚠️ Clip added but may be at wrong position!")
+            else:
+                logger.warning("   DeleteClips failed")
 
-            # POST-REPLACEMENT VALIDATION
-            logger.info(f"🎉 Clip replacement complete: {len(replaced_slots)}/{len(imported_clips)} slots replaced")
-            logger.info(f"   Replaced slots: {sorted(replaced_slots)}")
+        except Exception as e:
+            logger.warning("   Delete-and-Add method failed: %s", e)
+            logger.warning(traceback.format_exc())
+        return None
+    
+    def _replace_via_media_pool_replace_clip(self, slot_number, slot_info, new_media_item, new_clip_path):
+        """METHOD 4: MediaPoolItem.ReplaceClip (LAST RESORT - corrupts template!)
 
-            # Show which method was used for each slot
-            logger.info(f"📊 Replacement methods summary:")
-            for slot in sorted(imported_clips.keys()):
-                method = replacement_methods.get(slot, "FAILED")
-                logger.info(f"   Slot {slot}: {method}")
+        WARNING: This modifies the source file reference globally.
+        Only used if all other methods fail
+        """
+        try:
+            logger.warning("   ⚠️ Falling back to MediaPoolItem.ReplaceClip (may corrupt template)...")
 
-            if len(replaced_slots) < len(imported_clips):
-                missing_slots = set(imported_clips.keys()) - set(replaced_slots)
-                logger.error(f"❌ CRITICAL: Failed to replace {len(missing_slots)} slot(s): {sorted(missing_slots)}")
-                logger.error(f"   ABORTING: Will not save or render incomplete timeline")
-                return False
+            original_media = slot_info.get('media_pool_item')
+            if original_media and _has(original_media, 'MediaPoolItem', 'ReplaceClip'):
+                original_name = original_media.GetName() if _has(original_media, 'MediaPoolItem', 'GetName') else "unknown"
+                logger.debug("   Original media pool item: '%s'", original_name)
+                logger.debug("   Replacing with: %s", new_clip_path)
 
-            logger.info(f"✅ SUCCESS: All {len(replaced_slots)} slots were successfully replaced")
-            return True
+                replace_result = original_media.ReplaceClip(new_clip_path)
+                logger.debug("   MediaPoolItem.ReplaceClip result: %s", replace_result)
 
+                if replace_result:
+                    logger.warning("✅ Slot %s: MediaPoolItem.ReplaceClip succeeded (template may be corrupted)", slot_number)
+                    return "MediaPoolItem.ReplaceClip"
+            else:
+                logger.warning("   MediaPoolItem.ReplaceClip not available")
         except Exception as e:
-            logger.error(f"Failed to replace clips from project: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return False
+            logger.warning("   MediaPoolItem.ReplaceClip failed: %s", e)
+        return None
     
-    def _seconds_to_frames(self, seconds, fps=23.976):
-        """Convert seconds to frames at project frame rate"""
-        return int(seconds * fps)
+    def _finalize_render(self, output_path):
+        """Clear the finished job from Resolve's render queue (one call) and return the output path"""
+        try:
+            if self._delete_all_render_jobs:
+                self._delete_all_render_jobs()
+                logger.info("🗑️ Cleared render queue after completion")
+        except Exception as cleanup_error:
+            logger.warning("Could not clear render queue after completion: %s", cleanup_error)
+        return str(output_path)
+    
+    def _probe_render_status(self, status_probes, method_name, *args):
+        """Call a bound render status method; drop it from status_probes if it raises or returns nothing"""
+        method = status_probes.get(method_name)
+        if method is None:
+            return None
+        try:
+            status = method(*args)
+        except Exception as e:
+            logger.debug("%s failed, not retrying for this render: %s", method_name, e)
+            status = None
+        if not status:
+            del status_probes[method_name]
+        return status
     
     def _extract_customer_names(self, job_data):
         """Extract customer names from job metadata and format them properly"""
@@ -1269,8 +1750,7 @@ class DaVinciAutomation:
             # Format: "Joe & Sam" or "Emily" from the InfoPage input
             if project_name:
                 # Remove common suffixes and clean up
-                clean_name = project_name.replace('_Flight', '').replace(' Flight', '')
-                clean_name = clean_name.replace('___', ' & ').replace('_', ' ')
+                clean_name = _CUSTOMER_NAME_RE.sub(_customer_name_sub, project_name)
                 
                 # Convert back to proper format for filename
                 # "Joe & Sam" -> "Joe&Sam"
@@ -1285,7 +1765,7 @@ class DaVinciAutomation:
             session_id = metadata.get('sessionId', '')
             if session_id:
                 # sessionId format might be "joe_&_sam" or similar
-                clean_session = session_id.replace('_&_', '&').replace('_', ' ')
+                clean_session = _SESSION_ID_RE.sub(_customer_name_sub, session_id)
                 if '&' in clean_session:
                     parts = [part.strip().title() for part in clean_session.split('&')]
                     return '&'.join(parts)
@@ -1296,7 +1776,7 @@ class DaVinciAutomation:
             return "Customer"
             
         except Exception as e:
-            logger.warning(f"Could not extract customer names: {e}")
+            logger.warning("Could not extract customer names: %s", e)
             return "Customer"
     
     def _save_project(self, project_name):
@@ -1312,13 +1792,13 @@ class DaVinciAutomation:
             # state. After render completes, we close the project without saving, and the
             # template remains pristine for the next render job.
 
-            logger.info(f"⏭️ Skipping save to preserve template integrity")
-            logger.info(f"   Rendering directly from in-memory state")
-            logger.info(f"   Template '{TEMPLATE_PROJECT_NAME}' will NOT be modified on disk")
+            logger.info("⏭️ Skipping save to preserve template integrity")
+            logger.info("   Rendering directly from in-memory state")
+            logger.info("   Template '%s' will NOT be modified on disk", TEMPLATE_PROJECT_NAME)
             return True
 
         except Exception as e:
-            logger.error(f"Failed in save_project: {e}")
+            logger.error("Failed in save_project: %s", e)
             return False
 
     def _close_project_without_saving(self):
@@ -1326,7 +1806,7 @@ class DaVinciAutomation:
         try:
             if self.current_project:
                 project_name = self.current_project.GetName()
-                logger.info(f"🔄 Closing project '{project_name}'")
+                logger.info("🔄 Closing project '%s'", project_name)
 
                 # Close the project first
                 self.project_manager.CloseProject(self.current_project)
@@ -1334,24 +1814,26 @@ class DaVinciAutomation:
                 # If this was a working copy (created via export/import), delete it
                 # This is safe because it's a TRUE copy, not the original template
                 if self.working_copy_name:
-                    logger.info(f"🗑️ Deleting working copy: {self.working_copy_name}")
+                    logger.info("🗑️ Deleting working copy: %s", self.working_copy_name)
                     try:
                         delete_result = self.project_manager.DeleteProject(self.working_copy_name)
                         if delete_result:
-                            logger.info(f"✅ Working copy deleted - template preserved")
+                            logger.info("✅ Working copy deleted - template preserved")
                         else:
-                            logger.warning(f"⚠️ Could not delete working copy (may need manual cleanup)")
+                            logger.warning("⚠️ Could not delete working copy (may need manual cleanup)")
                     except Exception as del_error:
-                        logger.warning(f"⚠️ Error deleting working copy: {del_error}")
+                        logger.warning("⚠️ Error deleting working copy: %s", del_error)
 
                 self.current_project = None
                 self.timeline = None
                 self.media_pool = None
                 self.working_copy_name = None
+                self._delete_all_render_jobs = None
+                self._track_cache, self._track_cache_timeline, self._item_media_cache = {}, None, {}
 
-                logger.info(f"✅ Project closed successfully")
+                logger.info("✅ Project closed successfully")
         except Exception as e:
-            logger.warning(f"Error closing project: {e}")
+            logger.warning("Error closing project: %s", e)
             # Not critical - project will be closed on next load anyway
     
     # Note: _sync_to_google_drive method removed
@@ -1363,15 +1845,13 @@ class DaVinciAutomation:
 
     def _render_project(self, job_data):
         """Set up and start rendering with customer-based naming, returns output file path on success"""
+        render_observer = None
         try:
             # Ensure output directory exists with organized structure
-            from datetime import datetime
             render_date = datetime.now()
             
             # Create organized folder structure: Year/Month/Day/CustomerName
-            year_folder = OUTPUT_FOLDER / str(render_date.year)
-            month_folder = year_folder / f"{render_date.month:02d}-{render_date.strftime('%B')}"
-            day_folder = month_folder / f"{render_date.day:02d}"
+            day_folder = OUTPUT_FOLDER / render_date.strftime("%Y/%m-%B/%d")
 
             # Extract customer names from job data
             customer_names = self._extract_customer_names(job_data)
@@ -1387,8 +1867,8 @@ class DaVinciAutomation:
             # Create filename: "Joe&Sam_20251025_143941" or "Emily_20251025_143941"
             render_filename = f"{customer_names}_{timestamp}"
 
-            logger.info(f"📁 Organized output structure: {customer_folder}")
-            logger.info(f"🎬 Customer-based filename: {render_filename}")
+            logger.info("📁 Organized output structure: %s", customer_folder)
+            logger.info("🎬 Customer-based filename: %s", render_filename)
 
             # Update output folder to use organized structure with customer subfolder
             organized_output_folder = customer_folder
@@ -1403,59 +1883,61 @@ class DaVinciAutomation:
                 "ExportAudio": True,
                 "FormatWidth": 1920,   # Safe default for template
                 "FormatHeight": 1080,  # Safe default for template
-                "FrameRate": "23.976", # Match template frame rate
+                "FrameRate": TIMELINE_FRAME_RATE, # Match template frame rate
                 "VideoQuality": 0,     # Automatic quality
             }
 
-            logger.info(f"Setting render settings: {render_settings}")
+            logger.info("Setting render settings: %s", render_settings)
 
             # Load render preset FIRST (if available) - this sets base quality settings
             try:
                 self.current_project.LoadRenderPreset(RENDER_PRESET)
-                logger.info(f"Loaded render preset: {RENDER_PRESET}")
+                logger.info("Loaded render preset: %s", RENDER_PRESET)
             except:
-                logger.warning(f"Could not load render preset {RENDER_PRESET}, using default settings")
+                logger.warning("Could not load render preset %s, using default settings", RENDER_PRESET)
 
             # Set MP4 format and H.264 codec EXPLICITLY using the correct API method
             # IMPORTANT: Format/codec names are case-sensitive and must match exactly
             # Based on DaVinci forum: use 'MP4' (not 'mp4') and 'H264' (not 'H.264')
             try:
-                # Log available formats and codecs for debugging
-                available_formats = self.current_project.GetRenderFormats()
-                logger.info(f"📋 Available render formats: {available_formats}")
-
-                # Log available codecs for MP4 (pass extension, not format name)
-                mp4_codecs = self.current_project.GetRenderCodecs('mp4')
-                logger.info(f"📋 Available codecs for mp4: {mp4_codecs}")
+                # The codec that worked for an earlier job skips the discovery round trips below
+                format_set = bool(self._render_codec) and \
+                    self.current_project.SetCurrentRenderFormatAndCodec('MP4', self._render_codec)
+                if format_set:
+                    logger.info("✅ SetCurrentRenderFormatAndCodec('MP4', '%s') succeeded", self._render_codec)
+                else:
+                    # Log available formats and codecs for debugging
+                    available_formats = self.current_project.GetRenderFormats()
+                    logger.info("📋 Available render formats: %s", available_formats)
 
-                # Log current format before change
-                current_format = self.current_project.GetCurrentRenderFormatAndCodec()
-                logger.info(f"📋 Current render format BEFORE: {current_format}")
+                    # Log available codecs for MP4 (pass extension, not format name)
+                    mp4_codecs = self.current_project.GetRenderCodecs('mp4')
+                    logger.info("📋 Available codecs for mp4: %s", mp4_codecs)
 
-                # Try exact known values first (case-sensitive!)
-                # On Silicon Mac, codec is likely 'H264' (no NVIDIA suffix)
-                format_set = self.current_project.SetCurrentRenderFormatAndCodec('MP4', 'H264')
+                    # Log current format before change
+                    current_format = self.current_project.GetCurrentRenderFormatAndCodec()
+                    logger.info("📋 Current render format BEFORE: %s", current_format)
 
-                if format_set:
-                    logger.info("✅ SetCurrentRenderFormatAndCodec('MP4', 'H264') succeeded")
-                else:
-                    logger.warning("⚠️ SetCurrentRenderFormatAndCodec('MP4', 'H264') returned False")
-                    # Try alternate codec names that might exist
-                    for codec_try in ['H264_Apple', 'H264_HW', 'h264', 'H.264']:
+                    # Try exact known values first (case-sensitive!)
+                    # On Silicon Mac, codec is likely 'H264' (no NVIDIA suffix), then alternates
+                    for codec_try in ['H264', 'H264_Apple', 'H264_HW', 'h264', 'H.264']:
                         format_set = self.current_project.SetCurrentRenderFormatAndCodec('MP4', codec_try)
                         if format_set:
-                            logger.info(f"✅ SetCurrentRenderFormatAndCodec('MP4', '{codec_try}') succeeded")
+                            logger.info("✅ SetCurrentRenderFormatAndCodec('MP4', '%s') succeeded", codec_try)
+                            self._render_codec = codec_try
                             break
+                        logger.warning("⚠️ SetCurrentRenderFormatAndCodec('MP4', '%s') returned False", codec_try)
 
-                # Verify the change took effect
-                new_format = self.current_project.GetCurrentRenderFormatAndCodec()
-                logger.info(f"📋 Current render format AFTER: {new_format}")
+                    # Verify the change took effect
+                    new_format = self.current_project.GetCurrentRenderFormatAndCodec()
+                    logger.info("📋 Current render format AFTER: %s", new_format)
 
-                if new_format.get('format', '').lower() != 'mp4':
-                    logger.warning(f"⚠️ Format is still {new_format.get('format')}, not MP4!")
+                    if new_format.get('format', '').lower() != 'mp4':
+                        logger.warning("⚠️ Format is still %s, not MP4!", new_format.get('format'))
+                        self._render_codec = None
 
             except Exception as e:
-                logger.warning(f"⚠️ Could not set render format: {e}")
+                logger.warning("⚠️ Could not set render format: %s", e)
 
             # Apply our render settings (excluding format which is set separately)
             try:
@@ -1465,26 +1947,42 @@ class DaVinciAutomation:
                 else:
                     logger.warning("⚠️ SetRenderSettings returned False but continuing")
             except Exception as e:
-                logger.error(f"❌ SetRenderSettings failed: {e}")
+                logger.error("❌ SetRenderSettings failed: %s", e)
                 raise Exception(f"Could not set render settings: {e}")
             
+            # Bind the queue-clearing call once: it runs now and again when the render completes
+            self._delete_all_render_jobs = (self.current_project.DeleteAllRenderJobs
+                                            if _has(self.current_project, 'Project', 'DeleteAllRenderJobs') else None)
+            
             # Clear any existing render jobs from the queue before starting
             try:
-                if hasattr(self.current_project, 'DeleteAllRenderJobs'):
-                    self.current_project.DeleteAllRenderJobs()
+                if self._delete_all_render_jobs:
+                    self._delete_all_render_jobs()
                     logger.info("🗑️ Cleared existing render queue")
             except Exception as e:
-                logger.warning(f"Could not clear render queue: {e}")
+                logger.warning("Could not clear render queue: %s", e)
 
             # Delete any existing output file to avoid detecting old renders
-            for ext in ['.mp4', '.mov', '.avi']:
-                old_file = organized_output_folder / f"{render_filename}{ext}"
-                if old_file.exists():
-                    try:
-                        old_file.unlink()
-                        logger.info(f"🗑️ Deleted old render file: {old_file}")
-                    except Exception as e:
-                        logger.warning(f"Could not delete old file {old_file}: {e}")
+            for old_file in _find_render_outputs(organized_output_folder, render_filename):
+                try:
+                    old_file.unlink()
+                    logger.info("🗑️ Deleted old render file: %s", old_file)
+                except Exception as e:
+                    logger.warning("Could not delete old file %s: %s", old_file, e)
+
+            # Wake the wait loop as soon as the output file is closed or moved into place,
+            # instead of only at the next poll (armed before rendering so the event can't be missed)
+            render_output_ready = self._render_wakeup = threading.Event()
+            if Observer is not None:
+                try:
+                    render_observer = Observer()
+                    render_observer.schedule(
+                        RenderOutputHandler(render_filename, render_output_ready),
+                        str(organized_output_folder), recursive=False)
+                    render_observer.start()
+                except Exception as e:
+                    logger.debug("Could not watch render output folder: %s", e)
+                    render_observer = None
 
             # Start rendering - we know these methods work from the diagnostic
             job_id = None
@@ -1492,144 +1990,157 @@ class DaVinciAutomation:
                 # Add render job first (required)
                 job_id = self.current_project.AddRenderJob()
                 if job_id:
-                    logger.info(f"✅ Render job added: {job_id}")
+                    logger.info("✅ Render job added: %s", job_id)
                 else:
                     raise Exception("AddRenderJob returned None")
 
+                # Builds that return True instead of the id would leave only the project-wide status
+                # calls; one GetRenderJobList call (the queue was just cleared) recovers the id so
+                # each poll is a single GetRenderJobStatus round trip
+                if not isinstance(job_id, str) and _has(self.current_project, 'Project', 'GetRenderJobList'):
+                    try:
+                        jobs_by_id = {job.get('JobId'): job for job in self.current_project.GetRenderJobList() or ()}
+                        job_id = next((listed_id for listed_id, job in jobs_by_id.items()
+                                       if str(job.get('OutputFilename', '')).startswith(render_filename)), job_id)
+                    except Exception as e:
+                        logger.debug("Could not look up render job id: %s", e)
+
                 # Start the rendering process
                 render_started = self.current_project.StartRendering()
                 if render_started:
-                    logger.info(f"✅ Rendering started successfully")
+                    logger.info("✅ Rendering started successfully")
                 else:
                     logger.warning("⚠️ StartRendering returned False but job was added")
 
             except Exception as e:
-                logger.error(f"❌ Failed to start rendering: {e}")
+                logger.error("❌ Failed to start rendering: %s", e)
                 raise Exception(f"Could not start rendering: {e}")
             
-            logger.info(f"Rendering started with job ID: {job_id}")
+            logger.info("Rendering started with job ID: %s", job_id)
             
             # Wait for render to complete with improved status monitoring
+            # Poll quickly right after starting, then back off towards RENDER_POLL_MAX mid-render
             last_progress = 0
-            render_timeout = 0
             max_timeout = 300  # 5 minutes max wait time
+            render_started_at = time.monotonic()
+            deadline = render_started_at + max_timeout
             
-            while render_timeout < max_timeout:
+            # If Resolve dies mid-render no status or file will ever arrive: the exit watch started
+            # on connect wakes the wait so it ends at once instead of running out the timeout
+            resolve_exited = self._resolve_exited
+            poll_delay = RENDER_POLL_MIN
+            next_file_check = 0.0  # Monotonic time of the next output file check (no-status fallback)
+            output_sizes = {}  # Output path -> size at the previous file check, to spot growth
+            last_folder_mtime = None  # Output folder mtime at the last empty directory read (no-status fallback)
+            # Status calls are bound once per render (each attribute fetch on the project proxy is a
+            # round trip); one that fails or returns nothing is dropped for the rest of the render
+            status_probes = {name: getattr(self.current_project, name)
+                             for name in ('GetRenderJobStatus', 'GetCurrentRenderJobStatus')
+                             if _has(self.current_project, 'Project', name)}
+            is_rendering_in_progress = (self.current_project.IsRenderingInProgress
+                                        if _has(self.current_project, 'Project', 'IsRenderingInProgress') else None)
+            last_wait_log = -RENDER_LOG_INTERVAL
+            mp4_output_path = organized_output_folder / f"{render_filename}.mp4"  # Built once, not per poll
+
+            # One clock read per pass covers the deadline, the elapsed-time log and the file check schedule
+            while (now := time.monotonic()) < deadline:
+                if resolve_exited.is_set():
+                    raise Exception("DaVinci Resolve exited during render")
+                render_timeout = int(now - render_started_at)  # Seconds elapsed, for logs
+                log_wait = render_timeout - last_wait_log >= RENDER_LOG_INTERVAL
+                if log_wait:
+                    last_wait_log = render_timeout
+
                 # Try different ways to get render status
                 status = None
                 try:
                     # Method 1: Get status by job ID (if available)
-                    if job_id and job_id != True and hasattr(self.current_project, 'GetRenderJobStatus') and callable(getattr(self.current_project, 'GetRenderJobStatus', None)):
-                        status = self.current_project.GetRenderJobStatus(job_id)
+                    if job_id and job_id != True:
+                        status = self._probe_render_status(status_probes, 'GetRenderJobStatus', job_id)
                     
                     # Method 2: Get current render status (if available)
-                    if not status and hasattr(self.current_project, 'GetCurrentRenderJobStatus') and callable(getattr(self.current_project, 'GetCurrentRenderJobStatus', None)):
-                        status = self.current_project.GetCurrentRenderJobStatus()
+                    if not status:
+                        status = self._probe_render_status(status_probes, 'GetCurrentRenderJobStatus')
                     
                     # Method 3: Check if rendering is still active (if available)
-                    if not status and hasattr(self.current_project, 'IsRenderingInProgress') and callable(getattr(self.current_project, 'IsRenderingInProgress', None)):
-                        is_rendering = self.current_project.IsRenderingInProgress()
+                    if not status and is_rendering_in_progress:
+                        is_rendering = is_rendering_in_progress()
                         if not is_rendering:
                             # Rendering completed, check for output file in organized folder
-                            output_path = organized_output_folder / f"{render_filename}.mp4"
-                            if output_path.exists():
-                                logger.info(f"Rendering completed successfully: {output_path}")
-                                return str(output_path)
-                            else:
-                                # Check with different extensions
-                                for ext in ['.mp4', '.mov', '.avi']:
-                                    alt_path = organized_output_folder / f"{render_filename}{ext}"
-                                    if alt_path.exists():
-                                        logger.info(f"Rendering completed successfully: {alt_path}")
-                                        return str(alt_path)
+                            outputs = _find_render_outputs(organized_output_folder, render_filename)
+                            if outputs:
+                                logger.info("Rendering completed successfully: %s", outputs[0])
+                                return str(outputs[0])
                                         
+                            if log_wait:
                                 logger.warning("Rendering finished but output file not found")
-                                continue
-                        else:
-                            logger.info(f"Rendering in progress... ({render_timeout}s elapsed)")
-                            time.sleep(5)
-                            render_timeout += 5
-                            continue
-                    else:
+                        elif log_wait:
+                            logger.info("Rendering in progress... (%ss elapsed)", render_timeout)
+                    elif not status:
                         # No render status methods available, wait longer before checking for file
                         # Only check every 10 seconds to avoid false positives from old files
-                        if render_timeout % 10 == 0:
-                            logger.info(f"No render status methods available, checking for output file... ({render_timeout}s elapsed)")
-
-                            # Check with different extensions
-                            for ext in ['.mp4', '.mov', '.avi']:
-                                alt_path = organized_output_folder / f"{render_filename}{ext}"
-                                if alt_path.exists():
-                                    # Verify file was created recently (within last 30 seconds)
-                                    import os
-                                    file_age = time.time() - os.path.getmtime(str(alt_path))
-
-                                    # Also check file size is growing (render in progress) or stable (render complete)
-                                    file_size = os.path.getsize(str(alt_path))
-
-                                    # If file is less than 1MB, it's probably still being created
-                                    if file_size < 1_000_000:
-                                        logger.debug(f"File exists but too small ({file_size:,} bytes), render likely in progress...")
-                                        continue
-
-                                    # Wait a bit and check if file size is still changing
-                                    time.sleep(2)
-                                    new_file_size = os.path.getsize(str(alt_path))
-
-                                    if new_file_size > file_size:
-                                        # File is still growing, render in progress
-                                        logger.debug(f"File still growing ({file_size:,} → {new_file_size:,} bytes), render in progress...")
-                                        continue
-
-                                    # File exists, is large enough, and not growing - render complete!
-                                    if file_age < 30:
-                                        logger.info(f"Rendering completed successfully: {alt_path} (file age: {file_age:.1f}s, size: {file_size:,} bytes)")
-
-                                        # Clear render queue after successful completion
-                                        try:
-                                            if hasattr(self.current_project, 'DeleteAllRenderJobs'):
-                                                self.current_project.DeleteAllRenderJobs()
-                                                logger.info("🗑️ Cleared render queue after completion")
-                                        except Exception as cleanup_error:
-                                            logger.warning(f"Could not clear render queue after completion: {cleanup_error}")
-
-                                        return str(alt_path)
-                                    else:
-                                        logger.warning(f"Found file but it's too old ({file_age:.1f}s), waiting for new render...")
-
-                        # Wait before next check
-                        time.sleep(5)
-                        render_timeout += 5
-                        continue
+                        if now >= next_file_check:
+                            next_file_check = now + 10
+                            if log_wait:
+                                logger.info("No render status methods available, checking for output file... (%ss elapsed)", render_timeout)
+
+                            # Until an output has appeared, an unchanged folder mtime (one stat) means
+                            # no file was created or renamed in, so the directory read can be skipped
+                            try:
+                                folder_mtime = os.stat(organized_output_folder).st_mtime_ns
+                            except OSError:
+                                folder_mtime = None
+                            if last_folder_mtime is None or folder_mtime != last_folder_mtime:
+                                candidates = _stat_render_outputs(organized_output_folder, render_filename)
+                                # Once an output exists it is sampled on every check (growth doesn't touch the
+                                # folder); a just-changed mtime isn't trusted on coarse-timestamp filesystems
+                                settled = folder_mtime is not None and time.time_ns() - folder_mtime > 2_000_000_000
+                                last_folder_mtime = folder_mtime if settled and not candidates else None
+                            else:
+                                candidates = ()
+
+                            # Check with different extensions (one directory read, one stat per candidate)
+                            for alt_path, file_size, file_mtime in candidates:
+                                # Verify file was created recently (within last 30 seconds)
+                                file_age = time.time() - file_mtime
+
+                                # If file is less than 1MB, it's probably still being created
+                                if file_size < 1_000_000:
+                                    logger.debug("File exists but too small (%s bytes), render likely in progress...", format(file_size, ','))
+                                    continue
+
+                                # A finalized container index answers at once; otherwise compare with the
+                                # size seen at the previous check, sampling a first sighting again shortly
+                                previous_size = output_sizes.get(alt_path)
+                                output_sizes[alt_path] = file_size
+                                if (previous_size is None or file_size > previous_size) \
+                                        and not _container_finalized(alt_path, file_size):
+                                    # File is still growing, render in progress
+                                    logger.debug("File still growing (%s → %s bytes), render in progress...", format(previous_size or 0, ','), format(file_size, ','))
+                                    next_file_check = min(next_file_check, now + 2)
+                                    continue
+
+                                # File exists, is large enough, and not growing - render complete!
+                                if file_age < 30:
+                                    logger.info("Rendering completed successfully: %s (file age: %.1fs, size: %s bytes)", alt_path, file_age, format(file_size, ','))
+                                    return self._finalize_render(alt_path)
+                                elif log_wait:
+                                    logger.warning("Found file but it's too old (%.1fs), waiting for new render...", file_age)
                     
                 except Exception as status_error:
-                    logger.warning(f"Error getting render status: {status_error}")
+                    if log_wait:
+                        logger.warning("Error getting render status: %s", status_error)
                     # Still check for output file even if status check fails
-                    output_path = organized_output_folder / f"{render_filename}.mp4"
-                    if output_path.exists():
-                        logger.info(f"Rendering completed successfully (status check failed): {output_path}")
-                        return str(output_path)
-                    
-                    time.sleep(2)
-                    render_timeout += 2
-                    continue
+                    if mp4_output_path in _find_render_outputs(organized_output_folder, render_filename):
+                        logger.info("Rendering completed successfully (status check failed): %s", mp4_output_path)
+                        return str(mp4_output_path)
                 
                 # Process status if we got one
                 if status and isinstance(status, dict):
                     job_status = status.get('JobStatus', 'Unknown')
                     if job_status == 'Complete':
-                        output_path = organized_output_folder / f"{render_filename}.mp4"
-                        logger.info(f"Rendering completed successfully: {output_path}")
-
-                        # Clear render queue after successful completion
-                        try:
-                            if hasattr(self.current_project, 'DeleteAllRenderJobs'):
-                                self.current_project.DeleteAllRenderJobs()
-                                logger.info("🗑️ Cleared render queue after completion")
-                        except Exception as cleanup_error:
-                            logger.warning(f"Could not clear render queue after completion: {cleanup_error}")
-
-                        return str(output_path)
+                        logger.info("Rendering completed successfully: %s", mp4_output_path)
+                        return self._finalize_render(mp4_output_path)
                     elif job_status == 'Failed':
                         raise Exception(f"Render failed: {status.get('Error', 'Unknown error')}")
                     elif job_status == 'Cancelled':
@@ -1638,112 +2149,501 @@ class DaVinciAutomation:
                     # Show progress
                     completion = status.get('CompletionPercentage', 0)
                     if completion and completion - last_progress >= 10:
-                        logger.info(f"Rendering progress: {completion}%")
+                        logger.info("Rendering progress: %s%%", completion)
                         last_progress = completion
-                else:
-                    logger.info(f"Waiting for render status... ({render_timeout}s elapsed)")
+                    # Close to done: poll quickly again so completion is noticed promptly
+                    if completion and completion >= 90:
+                        poll_delay = RENDER_POLL_MIN
+                elif status and log_wait:
+                    logger.info("Waiting for render status... (%ss elapsed)", render_timeout)
                 
-                time.sleep(5)
-                render_timeout += 5
+                if render_output_ready.wait(max(0.0, min(poll_delay, deadline - time.monotonic()))):
+                    # Output was just finalized: check status and the file right away
+                    render_output_ready.clear()
+                    next_file_check = 0.0
+                    poll_delay = RENDER_POLL_MIN
+                    continue
+                poll_delay = min(poll_delay * 1.2, RENDER_POLL_MAX)
             
             raise Exception(f"Render timeout after {max_timeout} seconds")
             
         except Exception as e:
-            logger.error(f"Failed to render project: {e}")
+            logger.error("Failed to render project: %s", e)
             return False
+        finally:
+            if render_observer is not None:
+                render_observer.stop()
+                render_observer.join()
 
 # ============================================================================
 # MAGNUMSTREAM INTEGRATION - CLI and Job Processing
 # ============================================================================
 
-def process_single_job(job_file_path):
+_BOOTSTRAPPED = False
+
+def _bootstrap_dirs():
+    """Create the queue/output/completed folders once per process"""
+    global _BOOTSTRAPPED
+    if _BOOTSTRAPPED:
+        return
+    for folder in (WATCH_FOLDER, OUTPUT_FOLDER, COMPLETED_FOLDER):
+        Path(folder).mkdir(parents=True, exist_ok=True)
+    _BOOTSTRAPPED = True
+
+def _finalize(src, dst):
+    """Move a finished job file with a single atomic rename, copying only across devices"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+def _validate_job(job_data):
+    """Cheap shape check of a job file; returns an error message or None"""
+    if not isinstance(job_data, dict):
+        return "job file is not a JSON object"
+    # No projectName check: process_job has always rendered unnamed jobs under its defaults
+    clips = job_data.get('clips')
+    if not isinstance(clips, dict) or not clips:
+        return "missing or empty clips"
+    for slot_num, clip_info in clips.items():
+        try:
+            slot_number = int(slot_num)
+        except (TypeError, ValueError):
+            return f"invalid slot key {slot_num!r}"
+        if slot_number not in CLIP_POSITIONS:
+            return f"unknown slot {slot_number}"
+        if not isinstance(clip_info, dict):
+            return f"slot {slot_number} is not an object"
+        if not isinstance(clip_info.get('fullPath'), str) or not isinstance(clip_info.get('filename'), str):
+            return f"slot {slot_number} is missing fullPath/filename"
+    return None
+
+def process_single_job(job_file_path, automation=None):
     """Process a single DaVinci job file (for CLI usage)"""
+    job_file = Path(job_file_path)  # Built once; reused for the read and the final move
     try:
-        with open(job_file_path, 'r') as f:
-            job_data = json.load(f)
-        
-        logger.info(f"Processing job file: {job_file_path}")
+        try:
+            job_data = _loads(job_file.read_bytes())
+        except ValueError as e:  # orjson.JSONDecodeError and json.JSONDecodeError both derive from it
+            problem = f"not valid JSON ({e})"
+        else:
+            logger.info("Processing job file: %s", job_file_path)
+            
+            # Reject malformed jobs before paying for the Resolve connection
+            problem = _validate_job(job_data)
+        if problem:
+            error_path = job_file.with_suffix('.error')
+            _finalize(job_file, error_path)
+            logger.error("Invalid job file (%s). Marked as: %s", problem, error_path)
+            return False
         
-        # Initialize automation
-        automation = DaVinciAutomation()
+        # Initialize automation unless a long-lived worker passed its own
+        if automation is None:
+            automation = DaVinciAutomation()
         
         # Process the job
         result = automation.process_job(job_data)
         
         if result:
             # Move job file to completed folder on success
-            completed_path = COMPLETED_FOLDER / Path(job_file_path).name
-            COMPLETED_FOLDER.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(job_file_path), str(completed_path))
-            logger.info(f"Job completed successfully. Moved to: {completed_path}")
+            completed_path = COMPLETED_FOLDER / job_file.name
+            COMPLETED_FOLDER.mkdir(parents=True, exist_ok=True)  # The only folder this path writes to
+            _finalize(job_file, completed_path)
+            logger.info("Job completed successfully. Moved to: %s", completed_path)
             return result
         else:
             # Mark job file as failed
-            error_path = Path(job_file_path).with_suffix('.error')
-            Path(job_file_path).rename(error_path)
-            logger.error(f"Job failed. Marked as: {error_path}")
+            error_path = job_file.with_suffix('.error')
+            _finalize(job_file, error_path)
+            logger.error("Job failed. Marked as: %s", error_path)
             return False
             
     except Exception as e:
-        logger.error(f"Error processing job file {job_file_path}: {e}")
+        logger.error("Error processing job file %s: %s", job_file_path, e)
         return False
 
+def _connect_to_worker():
+    """Return a socket connected to a running --serve worker, or None if none is listening"""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(JOB_SOCKET))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+def _submit_to_worker(job_file_path):
+    """Hand a job to a running --serve worker; returns its reply, or None if none is listening"""
+    sock = _connect_to_worker()
+    if sock is None:
+        return None
+    # Once connected the worker may already be rendering the job, so a lost reply is a
+    # failure, never "no worker" (the caller would render the job a second time)
+    with sock:
+        try:
+            sock.sendall(f"{Path(job_file_path).resolve()}\n".encode())
+            # Blocks for the whole render; the worker replies once the job is finalized
+            with sock.makefile('r', encoding='utf-8') as reply:
+                return reply.readline().strip() or "FAILED: worker closed the connection without replying"
+        except OSError as e:
+            return f"FAILED: lost connection to worker ({e})"
+
+def serve_jobs(automation):
+    """Process job paths sent over JOB_SOCKET with one persistent Resolve connection"""
+    class JobRequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            job_path = self.rfile.readline().decode('utf-8').strip()
+            if not job_path:
+                return  # Liveness probe (see --serve startup) or a client that hung up
+            job_file = Path(job_path)
+            if not job_file.exists():
+                logger.error("Job file not found: %s", job_file)
+                result = None
+            else:
+                result = process_single_job(job_file, automation)
+            reply = f"SUCCESS: {result}" if result else "FAILED"
+            self.wfile.write(f"{reply}\n".encode('utf-8'))
+    
+    # A stale socket file from a crashed worker would make bind() fail (the caller has
+    # already checked that no live worker answers on it)
+    JOB_SOCKET.unlink(missing_ok=True)
+    # Requests are handled one at a time: Resolve can only render one job anyway
+    with socketserver.UnixStreamServer(str(JOB_SOCKET), JobRequestHandler) as server:
+        logger.info("Serving jobs on %s", JOB_SOCKET)
+        try:
+            server.serve_forever()
+        finally:
+            JOB_SOCKET.unlink(missing_ok=True)
+
+def _read_mounts():
+    """Return (mount_point, fs_type) pairs from /proc/mounts (Linux) or `mount` (macOS)"""
+    try:
+        with open('/proc/mounts') as f:
+            return [tuple(line.split()[1:3]) for line in f]
+    except OSError:
+        pass
+    
+    # macOS: "//user@host/share on /Volumes/share (smbfs, nodev, ...)"
+    try:
+        output = subprocess.run(['mount'], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    mounts = []
+    for line in output.splitlines():
+        match = re.match(r'^.* on (.*) \(([^,)]+)', line)
+        if match:
+            mounts.append((match.group(1), match.group(2)))
+    return mounts
+
+@functools.lru_cache(maxsize=None)
+def _detect_network_fs(path):
+    """Return True if path lives on an SMB/NFS/SSHFS mount (cached per path)"""
+    # The longest mount point that prefixes the path is the one it lives on
+    resolved = str(Path(path).resolve())
+    best_mount, best_type = "", None
+    for mount_point, fs_type in _read_mounts():
+        if (resolved == mount_point or resolved.startswith(mount_point.rstrip('/') + '/')) \
+                and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+class RenderOutputHandler(FileSystemEventHandler):
+    """Signal when a render output file is closed (inotify), renamed into place or
+    written out with its closing index (FSEvents, which never reports a close)"""
+    
+    def __init__(self, render_filename, ready):
+        super().__init__()
+        self.names = _render_output_names(render_filename)
+        self.ready = ready
+        self.next_probe = 0.0  # Monotonic time before which write events aren't probed again
+    
+    def on_closed(self, event):
+        if os.path.basename(event.src_path) in self.names:
+            self.ready.set()
+    
+    def on_moved(self, event):
+        if os.path.basename(event.dest_path) in self.names:
+            self.ready.set()
+    
+    def on_created(self, event):
+        self._probe_finalized(event)
+    
+    def on_modified(self, event):
+        self._probe_finalized(event)
+    
+    def _probe_finalized(self, event):
+        if event.is_directory or os.path.basename(event.src_path) not in self.names:
+            return
+        # inotify reports every write: probe at most once per RENDER_POLL_MIN (on_closed covers the end)
+        now = time.monotonic()
+        if now < self.next_probe:
+            return
+        self.next_probe = now + RENDER_POLL_MIN
+        path = Path(event.src_path)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return
+        if _container_finalized(path, size):
+            self.ready.set()
+
+class JobHandler(FileSystemEventHandler):
+    """Hand job files reported by the observer to the watcher"""
+    
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+    
+    def on_created(self, event):
+        if not event.is_directory and event.src_path.endswith('.json'):
+            self._dispatch(event.src_path)
+    
+    def on_moved(self, event):
+        if not event.is_directory and event.dest_path.endswith('.json'):
+            self._dispatch(event.dest_path)
+    
+    def on_closed(self, event):
+        # inotify CLOSE_WRITE: the producer has finished writing in place
+        if not event.is_directory and event.src_path.endswith('.json'):
+            self._dispatch(event.src_path)
+    
+    def _dispatch(self, path):
+        # Observer callbacks run on watchdog's thread; hand off to the watcher's event loop
+        self.watcher.enqueue_threadsafe(Path(path))
+
 class JobWatcher:
-    """Watch for new jobs from the MagnumStream Mac service"""
+    """Watch for new jobs from the MagnumStream Mac service
+    
+    Producer contract: write <name>.json.tmp and rename it to <name>.json, or
+    write <name>.json in place and close it. In-place writes are only read once
+    the file has been untouched for JOB_SETTLE_SECONDS.
+    """
     
     def __init__(self, automation):
         self.automation = automation
         self.watch_folder = Path(WATCH_FOLDER)
-        self.watch_folder.mkdir(parents=True, exist_ok=True)
-        OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
-        COMPLETED_FOLDER.mkdir(parents=True, exist_ok=True)
+        self.completed_folder = Path(COMPLETED_FOLDER)
+        _bootstrap_dirs()
+        
+        # Decided once: network mounts need a polling observer
+        self._is_network_fs = FORCE_POLLING or _detect_network_fs(str(self.watch_folder))
+        
+        # Resolve's scripting session is single-threaded: run every job on one dedicated thread
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="davinci-render")
+        
+        # One keep-alive session so a burst of completions reuses a single connection
+        self._http = None
+        if COMPLETION_WEBHOOK_URL and requests is not None:
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            self._http.mount('http://', adapter)
+            self._http.mount('https://', adapter)
+    
+    def _make_observer(self):
+        """Native events for local disks, slow polling for network mounts"""
+        if self._is_network_fs:
+            logger.info("Watch folder is on a network mount, polling every %ss", NETWORK_POLL_INTERVAL)
+            return PollingObserver(timeout=NETWORK_POLL_INTERVAL)
+        return Observer()
     
-    def watch(self):
-        """Main watch loop"""
-        logger.info(f"Watching folder: {self.watch_folder}")
+    async def watch(self):
+        """Main watch loop - discovery and rendering run concurrently"""
+        logger.info("Watching folder: %s", self.watch_folder)
         
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+        self._ready = asyncio.Queue(maxsize=1)  # Parsed jobs waiting for the render thread
+        self._inflight = set()  # Job files queued or being processed
+        # These loops never return, so a finished task means one of them died
+        tasks = {asyncio.create_task(self._preparer(), name="preparer"),
+                 asyncio.create_task(self._worker(), name="worker")}
+        
+        try:
+            # Pick up jobs that were dropped before we started
+            await self._sweep()
+            
+            if Observer is None:
+                logger.warning("watchdog not installed, polling every %ss", WATCH_POLL_INTERVAL)
+                tasks.add(asyncio.create_task(self._poll(), name="poller"))
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            else:
+                observer = self._make_observer()
+                observer.schedule(JobHandler(self), str(self.watch_folder), recursive=False)
+                observer.start()
+                try:
+                    # Events do the work; an occasional sweep catches anything they missed
+                    # (e.g. an inotify queue overflow or an FSEvents stream restart)
+                    while True:
+                        done, _ = await asyncio.wait(tasks, timeout=WATCH_RESCAN_INTERVAL,
+                                                     return_when=asyncio.FIRST_EXCEPTION)
+                        if done:
+                            break
+                        await self._sweep()
+                finally:
+                    observer.stop()
+                    observer.join()
+            
+            for task in done:
+                logger.error("Job %s task stopped, shutting down the watcher", task.get_name())
+                task.result()  # Re-raises whatever ended it
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let a job that is mid-render finish before exiting
+            self._pool.shutdown(wait=True)
+    
+    def enqueue_threadsafe(self, job_file):
+        """Queue a job file from a non-event-loop thread"""
+        asyncio.run_coroutine_threadsafe(self._enqueue(job_file), self._loop)
+    
+    async def _enqueue(self, job_file):
+        """Queue a job file once, even if it is reported repeatedly"""
+        if str(job_file) in self._inflight:
+            return
+        self._inflight.add(str(job_file))
+        await self._queue.put(job_file)
+    
+    async def _preparer(self):
+        """Read and validate queued jobs while the current one renders"""
+        while True:
+            # Everything discovered in the same wakeup is read together so the reads
+            # (and settle waits) overlap instead of running back to back
+            batch = [await self._queue.get()]
+            while len(batch) < JOB_READ_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            results = await asyncio.gather(*(self._load(job_file) for job_file in batch),
+                                           return_exceptions=True)
+            for job_file, job_data in zip(batch, results):
+                self._queue.task_done()
+                if isinstance(job_data, Exception):
+                    logger.error("Error reading job %s: %s", job_file, job_data)
+                    job_data = None
+                if job_data is None:
+                    self._inflight.discard(str(job_file))
+                    continue
+                await self._ready.put((job_file, job_data))
+    
+    async def _worker(self):
+        """Process prepared jobs one at a time on the render thread"""
+        while True:
+            job_file, job_data = await self._ready.get()
+            try:
+                await self._loop.run_in_executor(self._pool, self._handle, job_file, job_data)
+            except Exception as e:
+                logger.error("Error handling job %s: %s", job_file, e)
+            finally:
+                self._inflight.discard(str(job_file))
+                self._ready.task_done()
+    
+    async def _poll(self):
+        """Fallback loop when watchdog is unavailable"""
+        # Dropping or renaming a job changes the folder mtime, so an idle poll is one stat rather
+        # than a directory read; a full sweep still runs every WATCH_RESCAN_INTERVAL to retry
+        # jobs left in place and to cover filesystems with coarse timestamps
+        last_mtime = None
+        next_full_sweep = time.monotonic() + WATCH_RESCAN_INTERVAL
         while True:
             try:
-                # Look for JSON job files
-                job_files = list(self.watch_folder.glob("*.json"))
-                
-                for job_file in job_files:
-                    logger.info(f"Found new job: {job_file.name}")
-                    
-                    # Read job data
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                    
-                    # Process the job
-                    if self.automation.process_job(job_data):
-                        # Move to completed folder on success
-                        completed_path = Path(COMPLETED_FOLDER) / job_file.name
-                        shutil.move(str(job_file), str(completed_path))
-                        
-                        # Notify web app of completion (you can implement webhook here)
-                        self._notify_completion(job_data['project_name'])
-                    else:
-                        # Move to error folder or rename with .error extension
-                        error_path = job_file.with_suffix('.error')
-                        job_file.rename(error_path)
-                
                 # Wait before checking again
-                time.sleep(5)
+                await asyncio.sleep(WATCH_POLL_INTERVAL)
+                folder_mtime = self.watch_folder.stat().st_mtime_ns
+                now = time.monotonic()
+                if folder_mtime == last_mtime and now < next_full_sweep:
+                    continue
+                await self._sweep()
+                # A just-changed mtime could hide a later write in the same timestamp tick
+                last_mtime = folder_mtime if time.time_ns() - folder_mtime > 2_000_000_000 else None
+                if now >= next_full_sweep:
+                    next_full_sweep = now + WATCH_RESCAN_INTERVAL
                 
-            except KeyboardInterrupt:
-                logger.info("Stopping job watcher...")
-                break
             except Exception as e:
-                logger.error(f"Error in watch loop: {e}")
-                time.sleep(10)
+                logger.error("Error in watch loop: %s", e)
+                await asyncio.sleep(10)
+    
+    async def _sweep(self):
+        """Queue every job file currently in the watch folder"""
+        # Name checks first: is_file() only runs for new .json entries, and uses d_type when it can
+        with os.scandir(self.watch_folder) as entries:
+            job_paths = [entry.path for entry in entries
+                         if entry.name.endswith('.json') and entry.path not in self._inflight
+                         and entry.is_file(follow_symlinks=False)]
+        for job_path in job_paths:
+            await self._enqueue(Path(job_path))
+    
+    async def _load(self, job_file):
+        """Wait for a job file to settle, then read it off the event loop"""
+        # Don't read a file the producer may still be flushing; sleeping here rather
+        # than in _prepare keeps a batch of settling files from pinning pool threads
+        while True:
+            try:
+                age = time.time() - job_file.stat().st_mtime
+            except FileNotFoundError:
+                # The same file can be reported twice (e.g. write then rename)
+                return None
+            if age >= JOB_SETTLE_SECONDS:
+                break
+            await asyncio.sleep(JOB_SETTLE_SECONDS - age)
+        return await asyncio.to_thread(self._prepare, job_file)
+    
+    def _prepare(self, job_file):
+        """Load and validate a settled job file; returns the job data, or None to skip it"""
+        logger.info("Found new job: %s", job_file.name)
+        
+        # Read job data; a settled file that still won't parse would otherwise be retried every sweep
+        try:
+            job_data = _loads(job_file.read_bytes())
+        except ValueError as e:  # orjson.JSONDecodeError and json.JSONDecodeError both derive from it
+            problem = f"not valid JSON ({e})"
+        else:
+            # Reject malformed jobs before any Resolve work
+            problem = _validate_job(job_data)
+            # Checked here, while the previous job still renders: a job none of whose clips exist
+            # would otherwise only fail after the template load and export
+            if not problem and not any(_clip_files_present(
+                    [os.fspath(clip_info['fullPath']) for clip_info in job_data['clips'].values()])):
+                problem = "none of the job's clip files exist"
+        if problem:
+            logger.error("Invalid job %s: %s", job_file.name, problem)
+            _finalize(job_file, job_file.with_suffix('.error'))
+            return None
+        return job_data
+    
+    def _handle(self, job_file, job_data):
+        """Render one prepared job and move it to completed/ or mark it .error"""
+        # Process the job
+        if self.automation.process_job(job_data):
+            # Move to completed folder on success
+            completed_path = self.completed_folder / job_file.name
+            _finalize(job_file, completed_path)
+            
+            # Notify web app of completion
+            self._notify_completion(job_data.get('projectName', job_data.get('project_name')))
+        else:
+            # Move to error folder or rename with .error extension
+            error_path = job_file.with_suffix('.error')
+            _finalize(job_file, error_path)
     
     def _notify_completion(self, project_name):
         """Notify web app that rendering is complete"""
-        # Implement webhook or API call to your web app
-        # Example:
-        # requests.post("http://your-web-app/api/render-complete", 
-        #               json={"project": project_name, "status": "complete"})
-        pass
+        if not COMPLETION_WEBHOOK_URL:
+            return
+        payload = {"project": project_name, "status": "complete"}
+        try:
+            if self._http is not None:
+                self._http.post(COMPLETION_WEBHOOK_URL, json=payload, timeout=(1, 5)).raise_for_status()
+            else:
+                request = urllib.request.Request(
+                    COMPLETION_WEBHOOK_URL, data=json.dumps(payload).encode('utf-8'),
+                    headers={'Content-Type': 'application/json'})
+                with urllib.request.urlopen(request, timeout=5):
+                    pass
+        except Exception as e:
+            # The render itself succeeded; a missed notification must not fail the job
+            logger.warning("Completion webhook failed for %s: %s", project_name, e)
 
 # ============================================================================
 # SAMPLE JOB JSON FORMAT
@@ -1779,26 +2679,36 @@ Expected JSON format from web app:
 # MAIN ENTRY POINT
 # ============================================================================
 
+_BANNER = "=" * 60
+
 def main():
     """Main entry point with CLI argument support"""
     parser = argparse.ArgumentParser(description='DaVinci Resolve Automation for MagnumStream')
     parser.add_argument('--job-file', type=str, help='Process a single job file')
     parser.add_argument('--watch', action='store_true', help='Watch folder for new jobs')
+    parser.add_argument('--serve', action='store_true',
+                        help='Keep Resolve connected and process job files sent by --job-file')
     parser.add_argument('--version', action='version', version='MagnumStream DaVinci Automation 1.0')
     
     args = parser.parse_args()
     
-    logger.info("="*60)
+    logger.info(_BANNER)
     logger.info("MagnumStream DaVinci Resolve Automation Started")
-    logger.info("="*60)
+    logger.info(_BANNER)
     
     if args.job_file:
         # Process single job file (used by Mac service)
         job_file = Path(args.job_file)
         if not job_file.exists():
-            logger.error(f"Job file not found: {job_file}")
+            logger.error("Job file not found: %s", job_file)
             sys.exit(1)
         
+        # Prefer a running --serve worker: it already holds the API and Resolve handle
+        reply = _submit_to_worker(job_file)
+        if reply is not None:
+            print(reply)
+            sys.exit(0 if reply.startswith("SUCCESS:") else 1)
+        
         result = process_single_job(job_file)
         if result:
             print(f"SUCCESS: {result}")  # Print output path for Mac service
@@ -1809,9 +2719,38 @@ def main():
     
     elif args.watch:
         # Watch mode for continuous processing
-        automation = DaVinciAutomation()
+        _use_worker_log()
+        _bootstrap_dirs()
+        try:
+            automation = DaVinciAutomation()
+        except Exception:
+            sys.exit(1)  # Already logged by _connect_to_resolve
         watcher = JobWatcher(automation)
-        watcher.watch()
+        try:
+            asyncio.run(watcher.watch())
+        except KeyboardInterrupt:
+            logger.info("Stopping job watcher...")
+            _flush_log()
+    
+    elif args.serve:
+        # Persistent worker for --job-file clients
+        _use_worker_log()
+        _bootstrap_dirs()
+        # Don't take the socket over from a worker that is still running
+        live_worker = _connect_to_worker()
+        if live_worker is not None:
+            live_worker.close()
+            logger.error("A --serve worker is already listening on %s", JOB_SOCKET)
+            sys.exit(1)
+        try:
+            automation = DaVinciAutomation()
+        except Exception:
+            sys.exit(1)  # Already logged by _connect_to_resolve
+        try:
+            serve_jobs(automation)
+        except KeyboardInterrupt:
+            logger.info("Stopping job worker...")
+            _flush_log()
     
     else:
         # Default: show usage
@@ -1819,6 +2758,7 @@ def main():
         print("\nExamples:")
         print("  python3 Davinci.py --job-file /path/to/job.json")
         print("  python3 Davinci.py --watch")
+        print("  python3 Davinci.py --serve")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file